@@ -4,6 +4,7 @@
 import boto3
 import logging
 import os
+from .serialization import SERIALIZER
 from mcp_server_opensearch.clusters_information import ClusterInfo, get_cluster
 from opensearchpy import OpenSearch, RequestsHttpConnection
 from requests_aws4auth import AWS4Auth
@@ -18,6 +19,28 @@ logger = logging.getLogger(__name__)
 # Constants
 OPENSEARCH_SERVICE = 'es'
 OPENSEARCH_SERVERLESS_SERVICE = 'aoss'
+# Default keep-alive connections per client, shared by concurrent tool calls
+CONNECTION_POOL_MAXSIZE = 32
+
+# Environment variables that affect how a client is built
+CLIENT_ENV_VARS = (
+    'OPENSEARCH_URL',
+    'OPENSEARCH_USERNAME',
+    'OPENSEARCH_PASSWORD',
+    'OPENSEARCH_TIMEOUT',
+    'OPENSEARCH_POOL_MAXSIZE',
+    'OPENSEARCH_SSL_VERIFY',
+    'OPENSEARCH_NO_AUTH',
+    'AWS_IAM_ARN',
+    'AWS_PROFILE',
+    'AWS_REGION',
+    'AWS_OPENSEARCH_SERVERLESS',
+)
+
+
+# Cache of initialized clients keyed by their connection settings, so that every
+# helper call reuses the same client and its pool of keep-alive connections
+_client_cache: Dict[tuple, OpenSearch] = {}
 
 # global profile variable from command line
 arg_profile = None
@@ -28,6 +51,30 @@ def set_profile(profile: str) -> None:
     arg_profile = profile
 
 
+def get_pool_maxsize() -> int:
+    """Get the connection pool size from the OPENSEARCH_POOL_MAXSIZE environment variable.
+
+    Values that are not positive integers are logged and replaced by the default.
+
+    Returns:
+        int: Maximum number of pooled keep-alive connections per client
+    """
+    value = os.getenv('OPENSEARCH_POOL_MAXSIZE', '').strip()
+    if not value:
+        return CONNECTION_POOL_MAXSIZE
+    try:
+        pool_maxsize = int(value)
+    except ValueError:
+        pool_maxsize = 0
+    if pool_maxsize < 1:
+        logger.warning(
+            f'Invalid OPENSEARCH_POOL_MAXSIZE "{value}", must be a positive integer; '
+            f'using {CONNECTION_POOL_MAXSIZE}'
+        )
+        return CONNECTION_POOL_MAXSIZE
+    return pool_maxsize
+
+
 def get_aws_region(cluster_info: ClusterInfo | None) -> str:
     """Get the AWS region based on priority order.
 
@@ -100,8 +147,42 @@ def is_serverless(cluster_info: ClusterInfo | None) -> bool:
     return os.getenv('AWS_OPENSEARCH_SERVERLESS', '').lower() == 'true'
 
 
+def clear_client_cache() -> None:
+    """Drop all cached OpenSearch clients."""
+    _client_cache.clear()
+
+
 def initialize_client_with_cluster(cluster_info: ClusterInfo | None) -> OpenSearch:
-    """Initialize an OpenSearch client with authentication.
+    """Return a cached OpenSearch client for the given connection settings.
+
+    Clients are cached by cluster information, relevant environment variables and the
+    command-line profile. Clients using IAM role authentication are not cached because
+    the assumed role credentials expire.
+
+    Args:
+        cluster_info: Optional cluster information
+
+    Returns:
+        OpenSearch: Client instance
+    """
+    cache_key = (
+        tuple(cluster_info.model_dump().items()) if cluster_info else None,
+        tuple(os.getenv(name) for name in CLIENT_ENV_VARS),
+        arg_profile,
+    )
+    client = _client_cache.get(cache_key)
+    if client is not None:
+        return client
+
+    client = create_client_with_cluster(cluster_info)
+    iam_arn = cluster_info.iam_arn if cluster_info else os.getenv('AWS_IAM_ARN', '')
+    if not iam_arn:
+        _client_cache[cache_key] = client
+    return client
+
+
+def create_client_with_cluster(cluster_info: ClusterInfo | None) -> OpenSearch:
+    """Create a new OpenSearch client with authentication.
 
     Authentication methods (in order):
     1. No authentication (only if OPENSEARCH_NO_AUTH=true environment variable is set)
@@ -160,6 +241,8 @@ def initialize_client_with_cluster(cluster_info: ClusterInfo | None) -> OpenSear
         'use_ssl': (parsed_url.scheme == 'https'),
         'verify_certs': os.getenv('OPENSEARCH_SSL_VERIFY', 'true').lower() != 'false',
         'connection_class': RequestsHttpConnection,
+        'pool_maxsize': get_pool_maxsize(),
+        'serializer': SERIALIZER,
     }
 
     if opensearch_timeout:
@@ -3,8 +3,13 @@
 
 import json
 import logging
+import os
+import time
+from .response_cache import ttl_cache
 from semver import Version
 from tools.tool_params import *
+from typing import Dict, Tuple
+
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -12,19 +17,23 @@ logger = logging.getLogger(__name__)
 
 # List all the helper functions, these functions perform a single rest call to opensearch
 # these functions will be used in tools folder to eventually write more complex tools
+@ttl_cache('normal')
 def list_indices(args: ListIndicesArgs) -> json:
     from .client import initialize_client
 
     client = initialize_client(args)
+    # Only the index column is needed when listing names without detail
+    columns = None if args.include_detail else 'index'
     # Pass index parameter to OpenSearch if provided
     # Supports comma-separated list and wildcards
     if args.index:
-        response = client.cat.indices(index=args.index, format='json')
+        response = client.cat.indices(index=args.index, format='json', h=columns)
     else:
-        response = client.cat.indices(format='json')
+        response = client.cat.indices(format='json', h=columns)
     return response
 
 
+@ttl_cache('normal')
 def get_index(args: ListIndicesArgs) -> json:
     """Get detailed information about a specific index.
 
@@ -41,6 +50,7 @@ def get_index(args: ListIndicesArgs) -> json:
     return response
 
 
+@ttl_cache('normal')
 def get_index_mapping(args: GetIndexMappingArgs) -> json:
     from .client import initialize_client
 
@@ -57,6 +67,7 @@ def search_index(args: SearchIndexArgs) -> json:
     return response
 
 
+@ttl_cache('normal')
 def get_shards(args: GetShardsArgs) -> json:
     from .client import initialize_client
 
@@ -65,6 +76,7 @@ def get_shards(args: GetShardsArgs) -> json:
     return response
 
 
+@ttl_cache('normal')
 def get_segments(args: GetSegmentsArgs) -> json:
     """Get information about Lucene segments in indices.
     
@@ -85,6 +97,7 @@ def get_segments(args: GetSegmentsArgs) -> json:
     return response
 
 
+@ttl_cache('normal')
 def get_cluster_state(args: GetClusterStateArgs) -> json:
     """Get the current state of the cluster.
     
@@ -98,17 +111,12 @@ def get_cluster_state(args: GetClusterStateArgs) -> json:
     
     client = initialize_client(args)
     
-    # Build parameters dictionary with non-None values
-    params = {}
-    if args.metric:
-        params['metric'] = args.metric
-    if args.index:
-        params['index'] = args.index
-        
-    response = client.cluster.state(**params)
+    # The client leaves empty path parts out of the URL
+    response = client.cluster.state(metric=args.metric, index=args.index)
     return response
 
 
+@ttl_cache('short')
 def get_nodes(args: CatNodesArgs) -> json:
     """Get information about nodes in the cluster.
     
@@ -122,13 +130,12 @@ def get_nodes(args: CatNodesArgs) -> json:
     
     client = initialize_client(args)
     
-    # If metrics is provided, use it as a parameter
-    metrics_param = args.metrics if args.metrics else None
-    
-    response = client.cat.nodes(format='json', h=metrics_param)
+    # The client drops query parameters that are None
+    response = client.cat.nodes(format='json', h=args.metrics or None)
     return response
 
 
+@ttl_cache('normal')
 def get_index_info(args: GetIndexInfoArgs) -> json:
     """Get detailed information about an index including mappings, settings, and aliases.
     
@@ -145,6 +152,7 @@ def get_index_info(args: GetIndexInfoArgs) -> json:
     return response
 
 
+@ttl_cache('short')
 def get_index_stats(args: GetIndexStatsArgs) -> json:
     """Get statistics about an index.
     
@@ -158,15 +166,12 @@ def get_index_stats(args: GetIndexStatsArgs) -> json:
     
     client = initialize_client(args)
     
-    # Build parameters dictionary with non-None values
-    params = {}
-    if args.metric:
-        params['metric'] = args.metric
-        
-    response = client.indices.stats(index=args.index, **params)
+    # The client leaves an empty metric out of the URL
+    response = client.indices.stats(index=args.index, metric=args.metric)
     return response
 
 
+@ttl_cache('short')
 def get_query_insights(args: GetQueryInsightsArgs) -> json:
     """Get insights about top queries in the cluster.
     
@@ -213,6 +218,7 @@ def get_nodes_hot_threads(args: GetNodesHotThreadsArgs) -> str:
     return response
 
 
+@ttl_cache('normal')
 def get_allocation(args: GetAllocationArgs) -> json:
     """Get information about shard allocation across nodes in the cluster.
     
@@ -232,6 +238,7 @@ def get_allocation(args: GetAllocationArgs) -> json:
     return response
 
 
+@ttl_cache('short')
 def get_long_running_tasks(args: GetLongRunningTasksArgs) -> json:
     """Get information about long-running tasks in the cluster, sorted by running time.
     
@@ -245,24 +252,17 @@ def get_long_running_tasks(args: GetLongRunningTasksArgs) -> json:
     
     client = initialize_client(args)
     
-    # Use the transport.perform_request method to make a direct REST API call
-    # since we need to sort by running_time which might not be directly supported by the client
-    response = client.transport.perform_request(
-        method='GET',
-        url='/_cat/tasks',
-        params={
-            's': 'running_time:desc',  # Sort by running time in descending order
-            'format': 'json'
-        }
-    )
+    # Sort by running time in descending order on the server
+    response = client.cat.tasks(format='json', s='running_time:desc')
     
-    # Limit the number of tasks returned if specified
+    # _cat/tasks has no size parameter, so the limit is applied to the sorted rows
     if args.limit and isinstance(response, list):
         return response[:args.limit]
     
     return response
 
 
+@ttl_cache('long')
 def get_nodes_info(args: GetNodesArgs) -> json:
     """Get detailed information about nodes in the cluster.
     
@@ -276,40 +276,51 @@ def get_nodes_info(args: GetNodesArgs) -> json:
     
     client = initialize_client(args)
     
-    # Build the URL path based on provided parameters
-    url_parts = ['/_nodes']
-    
-    # Add node_id if provided
-    if args.node_id:
-        url_parts.append(args.node_id)
-    
-    # Add metric if provided
-    if args.metric:
-        url_parts.append(args.metric)
-    
-    url = '/'.join(url_parts)
-    
-    # Use the transport.perform_request method to make a direct REST API call
-    response = client.transport.perform_request(
-        method='GET',
-        url=url
-    )
-    
+    # The typed API builds and escapes the /_nodes/{node_id}/{metric} path,
+    # skipping any part that is not provided
+    response = client.nodes.info(node_id=args.node_id or None, metric=args.metric or None)
     return response
 
 
+# Seconds a fetched cluster version is reused before it is checked again, so that
+# an upgraded cluster is eventually noticed without a server restart
+VERSION_CACHE_TTL = 300.0
+
+# Cluster versions keyed by connection identity (cluster name, OPENSEARCH_URL)
+# Value: (expiry on the monotonic clock, version)
+_version_cache: Dict[Tuple[str, str], Tuple[float, Version]] = {}
+
+
+def invalidate_version_cache() -> None:
+    """Drop all cached OpenSearch versions."""
+    _version_cache.clear()
+
+
 def get_opensearch_version(args: baseToolArgs) -> Version:
     """Get the version of OpenSearch cluster.
 
+    The version is fetched once per connection and reused for VERSION_CACHE_TTL seconds.
+
     Returns:
         Version: The version of OpenSearch cluster (SemVer style)
     """
     from .client import initialize_client
 
+    key = (
+        args.opensearch_cluster_name if args is not None else '',
+        os.getenv('OPENSEARCH_URL', ''),
+    )
+    now = time.monotonic()
+    cached = _version_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
     try:
         client = initialize_client(args)
         response = client.info()
-        return Version.parse(response['version']['number'])
+        version = Version.parse(response['version']['number'])
     except Exception as e:
         logger.error(f'Error getting OpenSearch version: {e}')
         return None
+    _version_cache[key] = (now + VERSION_CACHE_TTL, version)
+    return version
@@ -0,0 +1,142 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+
+# Freshness bounds in seconds (min, max) for each cache policy:
+# - short: fast-changing data such as running tasks and node load metrics
+# - normal: index and shard metadata
+# - long: data that rarely changes such as node info and the cluster version
+CACHE_POLICIES: Dict[str, Tuple[float, float]] = {
+    'short': (1.0, 10.0),
+    'normal': (10.0, 30.0),
+    'long': (30.0, 60.0),
+}
+
+# Added to the time taken to produce a response when computing its freshness lifetime
+FRESHNESS_BUFFER = 5.0
+
+# Upper bound on cached responses; the least recently used response is evicted first.
+# Cluster state, segment and mapping responses can be several MB each.
+MAX_CACHE_ENTRIES = 256
+
+# Environment variables that select the cluster and the identity used to query it
+# when no cluster name is passed in the tool arguments (single-cluster mode)
+CONNECTION_ENV_VARS = (
+    'OPENSEARCH_URL',
+    'OPENSEARCH_USERNAME',
+    'OPENSEARCH_NO_AUTH',
+    'AWS_IAM_ARN',
+    'AWS_PROFILE',
+    'AWS_REGION',
+    'AWS_OPENSEARCH_SERVERLESS',
+)
+
+# Cached responses keyed by (helper name, serialized arguments, connection settings),
+# least recently used first
+# Value: (expiry on the monotonic clock, response)
+_response_cache: 'OrderedDict[Tuple[str, str, tuple], Tuple[float, Any]]' = OrderedDict()
+
+# Helpers run in worker threads, so cache updates are serialized
+_cache_lock = threading.Lock()
+
+
+def is_response_cache_enabled() -> bool:
+    """Check if response caching is enabled via the OPENSEARCH_RESPONSE_CACHE variable."""
+    return os.getenv('OPENSEARCH_RESPONSE_CACHE', 'true').lower() != 'false'
+
+
+def clear_response_cache() -> None:
+    """Drop all cached responses."""
+    with _cache_lock:
+        _response_cache.clear()
+
+
+def _purge_expired(now: float) -> None:
+    """Remove expired responses, then the least recently used ones beyond the limit.
+
+    Must be called with _cache_lock held.
+    """
+    for key, (expires_at, _) in list(_response_cache.items()):
+        if expires_at <= now:
+            del _response_cache[key]
+    while len(_response_cache) > MAX_CACHE_ENTRIES:
+        _response_cache.popitem(last=False)
+
+
+def freshness_lifetime(policy: str, elapsed: float) -> float:
+    """Compute how long a response stays fresh.
+
+    Responses that are slow to produce are kept longer, bounded by the policy limits.
+
+    Args:
+        policy: Name of the cache policy ('short', 'normal' or 'long')
+        elapsed: Seconds it took to produce the response
+
+    Returns:
+        float: Freshness lifetime in seconds
+    """
+    min_ttl, max_ttl = CACHE_POLICIES[policy]
+    return max(min_ttl, min(max_ttl, elapsed + FRESHNESS_BUFFER))
+
+
+def ttl_cache(policy: str) -> Callable:
+    """Cache the responses of a read-only helper function for a short time.
+
+    The cache key is the helper name, its arguments serialized to JSON and the
+    connection settings in CONNECTION_ENV_VARS, so it covers the target cluster in both
+    multi-cluster and single-cluster mode as well as every request parameter.
+    Exceptions and None responses are never cached. Expired responses are dropped as soon as they are
+    looked up or another response is stored, and at most MAX_CACHE_ENTRIES are kept.
+
+    Cached responses are not copied: every caller within the freshness lifetime gets
+    the same dict or list, so callers must not modify a response.
+
+    Args:
+        policy: Name of the cache policy ('short', 'normal' or 'long')
+
+    Returns:
+        Callable: Decorator for helper functions taking a single tool arguments model
+    """
+    if policy not in CACHE_POLICIES:
+        raise ValueError(f'Unknown cache policy: {policy}')
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(args):
+            if not is_response_cache_enabled():
+                return func(args)
+
+            key = (
+                func.__qualname__,
+                args.model_dump_json() if args is not None else '',
+                tuple(os.getenv(name) for name in CONNECTION_ENV_VARS),
+            )
+            now = time.monotonic()
+            with _cache_lock:
+                cached = _response_cache.get(key)
+                if cached is not None:
+                    if cached[0] > now:
+                        _response_cache.move_to_end(key)
+                        return cached[1]
+                    del _response_cache[key]
+
+            response = func(args)
+            if response is not None:
+                finished = time.monotonic()
+                expires_at = finished + freshness_lifetime(policy, finished - now)
+                with _cache_lock:
+                    _response_cache[key] = (expires_at, response)
+                    _response_cache.move_to_end(key)
+                    _purge_expired(finished)
+            return response
+
+        return wrapper
+
+    return decorator
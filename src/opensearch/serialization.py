@@ -0,0 +1,55 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from opensearchpy import JSONSerializer
+from typing import Any
+
+
+try:
+    import orjson
+except ImportError:  # installed with the optional 'orjson' extra
+    orjson = None
+
+
+class OrjsonSerializer(JSONSerializer):
+    """JSON serializer that encodes and decodes with orjson.
+
+    Anything orjson rejects (e.g. NaN literals or integers wider than 64 bits) is
+    handed to the standard library serializer, so behavior matches JSONSerializer.
+    """
+
+    def loads(self, s: str) -> Any:
+        """Decode a JSON response body."""
+        try:
+            return orjson.loads(s)
+        except (ValueError, TypeError):
+            return super().loads(s)
+
+    def dumps(self, data: Any) -> Any:
+        """Encode a request body as JSON."""
+        # don't serialize strings
+        if isinstance(data, str):
+            return data
+
+        try:
+            encoded = orjson.dumps(data, default=self.default, option=orjson.OPT_NON_STR_KEYS)
+            return encoded.decode('utf-8')
+        except TypeError:
+            return super().dumps(data)
+
+
+# Serializer shared by all clients, backed by orjson when it is installed
+SERIALIZER = OrjsonSerializer() if orjson is not None else JSONSerializer()
+
+
+def dumps_indented(data: Any) -> str:
+    """Serialize a response as JSON indented by two spaces, using orjson when installed."""
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            return encoded.decode('utf-8')
+        except TypeError:
+            # Types orjson cannot serialize natively
+            pass
+    return json.dumps(data, indent=2)
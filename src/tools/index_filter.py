@@ -2,12 +2,129 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import fnmatch
+import functools
 import json
 import logging
 import os
 import re
-import yaml
-from typing import Dict, List, Optional
+from opensearch.response_cache import clear_response_cache
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+
+try:
+    # google-re2 guarantees linear-time matching of wildcard patterns, which bounds the
+    # cost of adversarial ones; it is optional and the stdlib re module is used without it
+    import re2
+except ImportError:
+    re2 = None
+
+# A configured pattern with its position in the configuration, so that the first
+# configured pattern matching an index name is the one that is reported
+_Position = Tuple[int, str]
+
+# Compiled form of a pattern list: (literal index names, (prefix, position) pairs,
+# (fused regex, group name to position) pairs, unfused patterns)
+_PatternMatcher = Tuple[
+    Dict[str, _Position],
+    List[Tuple[str, _Position]],
+    List[Tuple[Pattern[str], Dict[str, _Position]]],
+    List[Tuple[_Position, Pattern[str]]],
+]
+
+_DEFAULT_REGEX_FLAGS = re.compile('').flags
+
+# Splits a comma-separated list of index names and trims the names in one pass
+_COMMA_SPLIT = re.compile(r'\s*,\s*')
+
+# RE2 class matching no character, used where fnmatch emits (?!)
+_RE2_NEVER_MATCH = r'[^\x00-\x{10FFFF}]'
+
+# Maximum number of index name decisions remembered per IndexFilterConfig
+_DECISION_CACHE_MAXSIZE = 4096
+
+
+def _translate_glob(pattern: str) -> str:
+    """
+    Translate a wildcard pattern into an unanchored regex.
+
+    fnmatch.translate wraps its output as (?s:...) followed by an end anchor. The
+    wrapper is removed so that all wildcard branches can share a single one.
+
+    :param pattern: The wildcard pattern
+    :return: Regex matching the same index names when followed by an end anchor
+    """
+    translated = fnmatch.translate(pattern)
+    if translated.startswith('(?s:') and translated.endswith(r')\Z'):
+        return translated[4:-3]
+    # Unknown output format, keep it whole; a repeated end anchor is harmless
+    return f'(?:{translated})'
+
+
+def _translate_glob_re2(pattern: str) -> str:
+    """
+    Translate a wildcard pattern into an unanchored regex in RE2 syntax.
+
+    For several wildcards combined with character classes fnmatch.translate emits
+    lookaheads and backreferences, which RE2 does not accept. Wildcards are therefore
+    translated here, and only each character class is translated by fnmatch.
+
+    :param pattern: The wildcard pattern
+    :return: Regex matching the same index names when followed by an end anchor
+    """
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        i += 1
+        if char == '*':
+            parts.append('.*')
+        elif char == '?':
+            parts.append('.')
+        elif char == '[':
+            # Find the end of the class the way fnmatch does; an unclosed [ is literal
+            j = i
+            if j < n and pattern[j] == '!':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            j = pattern.find(']', j)
+            if j < 0:
+                parts.append(re.escape(char))
+            else:
+                translated = _translate_glob(pattern[i - 1 : j + 1])
+                # An empty range such as [z-a] never matches; RE2 has no (?!)
+                parts.append(translated if translated != '(?!)' else _RE2_NEVER_MATCH)
+                i = j + 1
+        else:
+            parts.append(re.escape(char))
+    return ''.join(parts)
+
+
+def _compile_glob_alternation(pattern: str, re2_pattern: str) -> Pattern[str]:
+    """
+    Compile the fused wildcard alternation, with RE2 when it is installed and supports it.
+
+    Only wildcard patterns are compiled with RE2, since their translation uses nothing
+    whose meaning differs between the engines. Regex patterns always use the re module,
+    because RE2 treats $ before a trailing newline and non-ASCII digits and word
+    characters differently, which would change which indices they match.
+
+    :param pattern: The alternation in re syntax
+    :param re2_pattern: The same alternation in RE2 syntax
+    :return: The compiled alternation
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(re2_pattern)
+        except re2.error as e:
+            # fnmatch.translate emits lookaheads and backreferences for some wildcards
+            logging.debug('Falling back to re for wildcard patterns: %s', e)
+    return re.compile(pattern)
+
+
+def _allow_all(index_name: str) -> tuple[bool, Optional[str]]:
+    """Allow any index, used as is_index_allowed when no patterns are configured."""
+    return True, None
 
 
 class IndexFilterConfig:
@@ -24,8 +141,33 @@ class IndexFilterConfig:
         :param allowed_index_patterns: List of allowed index patterns (wildcards and regex)
         :param denied_index_patterns: List of denied index patterns (wildcards and regex)
         """
-        self.allowed_index_patterns = allowed_index_patterns or []
-        self.denied_index_patterns = denied_index_patterns or []
+        # Copied so that the caller's lists, such as a cached YAML parse, are never shared
+        self.allowed_index_patterns = list(allowed_index_patterns or [])
+        self.denied_index_patterns = list(denied_index_patterns or [])
+        # Allowed patterns as a comma-separated index expression for OpenSearch requests
+        self.allowed_index_expression = ','.join(self.allowed_index_patterns)
+        # With no patterns configured every index is allowed, which is the default
+        self._empty = not (self.allowed_index_patterns or self.denied_index_patterns)
+
+        # Compile every pattern once up front so matching never pays for
+        # regex compilation or glob translation on the request path
+        self._first_allowed = self._build_first_match(
+            self._compile_patterns(self.allowed_index_patterns)
+        )
+        self._first_denied = self._build_first_match(
+            self._compile_patterns(self.denied_index_patterns)
+        )
+
+        # Bounded LRU cache of decisions per index name string; a reloaded
+        # configuration is a new instance and therefore starts with an empty cache
+        self._cached_check = functools.lru_cache(maxsize=_DECISION_CACHE_MAXSIZE)(
+            self._check_index_names
+        )
+
+        # With no patterns the answer never depends on the name, so replace the
+        # check with a function that skips every branch
+        if self._empty:
+            self.is_index_allowed = _allow_all
 
     def is_index_allowed(self, index_name: str) -> tuple[bool, Optional[str]]:
         """
@@ -40,14 +182,38 @@ class IndexFilterConfig:
         if not index_name:
             return True, None
 
+        # A single name with wildcards is allowed without touching the cache or
+        # the patterns; in a comma-separated list every other name is still checked
+        if ('*' in index_name or '?' in index_name) and ',' not in index_name:
+            return self._check_single_index(index_name)
+
+        decision = self._cached_check(index_name)
+        if not decision[0]:
+            # Logged outside the cache so that every denied access is reported
+            logging.warning(decision[1])
+        return decision
+
+    def _check_index_names(self, index_name: str) -> tuple[bool, Optional[str]]:
+        """Check a possibly comma-separated list of index names against patterns."""
+        # Fast path: a single index name needs no list, and no strip unless padded
+        if ',' not in index_name:
+            if index_name[:1].isspace() or index_name[-1:].isspace():
+                index_name = index_name.strip()
+            return self._check_single_index(index_name)
+
         # Handle comma-separated index names or wildcards in a single string
         # Some tools may pass multiple indexes like "index1,index2"
-        index_names = [name.strip() for name in index_name.split(',')]
-
-        for single_index in index_names:
-            allowed, reason = self._check_single_index(single_index)
-            if not allowed:
-                return False, reason
+        # Split once and run the compiled matchers over every name in one loop
+        first_denied = self._first_denied
+        first_allowed = self._first_allowed if self.allowed_index_patterns else None
+        for single_index in _COMMA_SPLIT.split(index_name.strip()):
+            if '*' in single_index or '?' in single_index:
+                continue
+            pattern = first_denied(single_index)
+            if pattern is not None:
+                return self._denied(single_index, pattern)
+            if first_allowed is not None and first_allowed(single_index) is None:
+                return self._not_allowed(single_index)
 
         return True, None
 
@@ -57,60 +223,295 @@ class IndexFilterConfig:
         # Allow it through - OpenSearch will handle the expansion
         if '*' in index_name or '?' in index_name:
             logging.debug(
-                f'Index pattern "{index_name}" contains wildcards, allowing through for OpenSearch expansion'
+                'Index pattern "%s" contains wildcards, allowing through for OpenSearch expansion',
+                index_name,
             )
             return True, None
 
         # Check denied patterns first (higher priority)
         if self.denied_index_patterns:
-            for pattern in self.denied_index_patterns:
-                if self._matches_pattern(index_name, pattern):
-                    reason = f'Index "{index_name}" matches denied pattern: {pattern}'
-                    logging.warning(reason)
-                    return False, reason
+            pattern = self._first_denied(index_name)
+            if pattern is not None:
+                return self._denied(index_name, pattern)
 
         # If allowed patterns are configured, index must match at least one
         if self.allowed_index_patterns:
-            for pattern in self.allowed_index_patterns:
-                if self._matches_pattern(index_name, pattern):
-                    logging.debug(f'Index "{index_name}" matches allowed pattern: {pattern}')
-                    return True, None
+            pattern = self._first_allowed(index_name)
+            if pattern is not None:
+                logging.debug('Index "%s" matches allowed pattern: %s', index_name, pattern)
+                return True, None
 
-            reason = f'Index "{index_name}" does not match any allowed patterns'
-            logging.warning(reason)
-            return False, reason
+            return self._not_allowed(index_name)
 
         # No patterns configured, allow all indexes
         return True, None
 
-    def _matches_pattern(self, index_name: str, pattern: str) -> bool:
+    @staticmethod
+    def _denied(index_name: str, pattern: str) -> tuple[bool, Optional[str]]:
+        """Build the decision for an index matching a denied pattern."""
+        return False, f'Index "{index_name}" matches denied pattern: {pattern}'
+
+    @staticmethod
+    def _not_allowed(index_name: str) -> tuple[bool, Optional[str]]:
+        """Build the decision for an index matching no allowed pattern."""
+        return False, f'Index "{index_name}" does not match any allowed patterns'
+
+    @staticmethod
+    def _compile_patterns(patterns: List[str]) -> _PatternMatcher:
         """
-        Check if an index name matches a pattern.
+        Compile index patterns into a few matchers that together find the first match.
 
         Supports:
         - Wildcards: * and ? (e.g., "logs-*", "test-?-index")
         - Regex patterns: patterns starting with "regex:" (e.g., "regex:^logs-\\d{4}-\\d{2}$")
 
-        :param index_name: The index name to check
-        :param pattern: The pattern to match against
-        :return: True if matches, False otherwise
+        Wildcard patterns without any wildcard characters name a single index and
+        are looked up in a dict instead of being compiled. Patterns whose only
+        wildcard is a trailing * are matched as prefixes with str.startswith. The other
+        wildcard patterns are fused into one alternation sharing a single end anchor,
+        and regex patterns into another. Every branch is a named group in configuration
+        order, so the group that matched names the first matching pattern of its kind.
+        Regex patterns that define their own groups or global inline flags cannot be
+        fused safely and are matched one by one instead. Invalid regex patterns are
+        logged and skipped, so they never match.
+
+        :param patterns: The configured patterns
+        :return: Tuple of (literal index names, prefix list, fused alternations with
+            their group positions, unfused pattern list)
         """
-        # Regex pattern (starts with "regex:")
-        if pattern.startswith('regex:'):
-            regex_pattern = pattern[6:]  # Remove "regex:" prefix
-            try:
-                return bool(re.match(regex_pattern, index_name))
-            except re.error as e:
-                logging.error(f'Invalid regex pattern "{regex_pattern}": {e}')
-                return False
+        literals: Dict[str, _Position] = {}
+        prefixes: List[Tuple[str, _Position]] = []
+        glob_branches: List[str] = []
+        re2_glob_branches: List[str] = []
+        glob_positions: Dict[str, _Position] = {}
+        regex_branches: List[str] = []
+        regex_positions: Dict[str, _Position] = {}
+        unfused: List[Tuple[_Position, Pattern[str]]] = []
+        for i, pattern in enumerate(patterns):
+            # Regex pattern (starts with "regex:")
+            if pattern.startswith('regex:'):
+                regex_pattern = pattern[6:]  # Remove "regex:" prefix
+                try:
+                    compiled = re.compile(regex_pattern)
+                except re.error as e:
+                    logging.error(f'Invalid regex pattern "{regex_pattern}": {e}')
+                    continue
+                if compiled.groups or compiled.flags != _DEFAULT_REGEX_FLAGS:
+                    unfused.append(((i, pattern), compiled))
+                    continue
+                regex_branches.append(f'(?P<p{i}>{regex_pattern})')
+                regex_positions[f'p{i}'] = (i, pattern)
+            elif not ('*' in pattern or '?' in pattern or '[' in pattern):
+                # Plain index name; keep the first pattern that names it
+                literals.setdefault(pattern, (i, pattern))
+                continue
+            elif pattern.endswith('*') and not any(c in pattern[:-1] for c in '*?['):
+                # Prefix pattern such as "logs-*"
+                prefixes.append((pattern[:-1], (i, pattern)))
+                continue
+            else:
+                # Wildcard pattern
+                glob_branches.append(f'(?P<p{i}>{_translate_glob(pattern)})')
+                re2_glob_branches.append(f'(?P<p{i}>{_translate_glob_re2(pattern)})')
+                glob_positions[f'p{i}'] = (i, pattern)
+
+        # Wildcard patterns must match the whole name, so they share one end anchor;
+        # regex patterns keep their own anchoring and only match from the start
+        fused: List[Tuple[Pattern[str], Dict[str, _Position]]] = []
+        if glob_branches:
+            glob_fused = _compile_glob_alternation(
+                f'(?s:{"|".join(glob_branches)})\\Z', f'(?s:{"|".join(re2_glob_branches)})\\z'
+            )
+            fused.append((glob_fused, glob_positions))
+        if regex_branches:
+            fused.append((re.compile('|'.join(regex_branches)), regex_positions))
+        return literals, prefixes, fused, unfused
+
+    @staticmethod
+    def _build_first_match(matcher: _PatternMatcher) -> Callable[[str], Optional[str]]:
+        """
+        Build a function that finds the first configured pattern matching an index name.
 
-        # Wildcard pattern
-        return fnmatch.fnmatch(index_name, pattern)
+        Each kind of pattern is matched by its own function returning the position and
+        pattern of its first match. The function is specialized for the shape of the
+        compiled patterns, so the common case of a single kind of pattern is one lookup
+        or match call with no loop. Otherwise the kinds are tried in order of their
+        first position, stopping once no remaining kind can match an earlier pattern.
+
+        :param matcher: The compiled patterns to match against
+        :return: Function taking an index name and returning the matching pattern or None
+        """
+        literals, prefixes, fused, unfused = matcher
+        # (first position, match function) for each kind of pattern
+        stages: List[Tuple[int, Callable[[str], Optional[_Position]]]] = []
+        if literals:
+            stages.append((min(literals.values())[0], literals.get))
+        if prefixes:
+            stages.append((prefixes[0][1][0], IndexFilterConfig._prefix_match(prefixes)))
+        for compiled, group_positions in fused:
+            fused_match = IndexFilterConfig._fused_match(compiled, group_positions)
+            stages.append((min(group_positions.values())[0], fused_match))
+        if unfused:
+            stages.append((unfused[0][0][0], IndexFilterConfig._unfused_match(unfused)))
+
+        if not stages:
+            return lambda index_name: None
+
+        if len(stages) == 1:
+            stage_match = stages[0][1]
+
+            def first_match(index_name: str) -> Optional[str]:
+                found = stage_match(index_name)
+                return found[1] if found is not None else None
+
+            return first_match
+
+        stages.sort(key=lambda stage: stage[0])
+        stage_tuple = tuple(stages)
+
+        def first_match(index_name: str) -> Optional[str]:
+            best = None
+            for first_position, stage_match in stage_tuple:
+                if best is not None and best[0] < first_position:
+                    break
+                found = stage_match(index_name)
+                if found is not None and (best is None or found[0] < best[0]):
+                    best = found
+            return best[1] if best is not None else None
+
+        return first_match
+
+    @staticmethod
+    def _prefix_match(
+        prefixes: List[Tuple[str, _Position]],
+    ) -> Callable[[str], Optional[_Position]]:
+        """Test all prefixes in one str.startswith call, then find the first that matched."""
+        prefix_tuple = tuple(prefix for prefix, _ in prefixes)
+
+        def match(index_name: str) -> Optional[_Position]:
+            if index_name.startswith(prefix_tuple):
+                # Only a hit needs to know which prefix matched
+                for prefix, position in prefixes:
+                    if index_name.startswith(prefix):
+                        return position
+            return None
+
+        return match
+
+    @staticmethod
+    def _fused_match(
+        compiled: Pattern[str], group_positions: Dict[str, _Position]
+    ) -> Callable[[str], Optional[_Position]]:
+        """Match a fused alternation and map the matching branch to its pattern."""
+        fused_match = compiled.match
+
+        def match(index_name: str) -> Optional[_Position]:
+            found = fused_match(index_name)
+            return group_positions[found.lastgroup] if found is not None else None
+
+        return match
+
+    @staticmethod
+    def _unfused_match(
+        unfused: List[Tuple[_Position, Pattern[str]]],
+    ) -> Callable[[str], Optional[_Position]]:
+        """Match regex patterns that could not be fused one by one."""
+        unfused_matches = tuple((position, compiled.match) for position, compiled in unfused)
+
+        def match(index_name: str) -> Optional[_Position]:
+            for position, compiled_match in unfused_matches:
+                if compiled_match(index_name) is not None:
+                    return position
+            return None
+
+        return match
 
 
 # Global index filter configuration
 _index_filter_config: Optional[IndexFilterConfig] = None
 
+# Last loaded configuration and the inputs it was loaded from, see _config_source_key
+_loaded_index_filter_config: Optional[Tuple[tuple, IndexFilterConfig]] = None
+
+
+def _config_source_key(config_file_path: str) -> tuple:
+    """
+    Identify the inputs of load_index_filter_config without parsing them.
+
+    :param config_file_path: Path to YAML configuration file
+    :return: Tuple of (path, file mtime and size, allowed env value, denied env value)
+    """
+    file_state: Optional[Tuple[int, int]] = None
+    if config_file_path:
+        try:
+            stat = os.stat(config_file_path)
+            file_state = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pass
+    env = os.environ
+    return (
+        config_file_path,
+        file_state,
+        env.get('OPENSEARCH_ALLOWED_INDEX_PATTERNS', ''),
+        env.get('OPENSEARCH_DENIED_INDEX_PATTERNS', ''),
+    )
+
+
+def _parse_env_patterns(env_name: str, value: str) -> List[str]:
+    """
+    Parse an index pattern list from an environment variable value.
+
+    Supports both a JSON array and a comma-separated list. The format is detected
+    from the first character, so comma-separated lists never go through the JSON parser.
+
+    :param env_name: Name of the environment variable, for log messages
+    :param value: The environment variable value
+    :return: The patterns, or an empty list if the value is empty or invalid
+    """
+    if not value:
+        return []
+    try:
+        if value.lstrip().startswith('['):
+            patterns = json.loads(value)
+        else:
+            patterns = [p for p in _COMMA_SPLIT.split(value.strip()) if p]
+    except json.JSONDecodeError as e:
+        logging.error(f'Error parsing {env_name}: {e}')
+        return []
+    logging.info(f'Loaded {env_name} from environment: {patterns}')
+    return patterns
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml(config_file_path: str, file_state: Optional[Tuple[int, int]]) -> Any:
+    """
+    Parse a YAML configuration file, reusing the result while the file is unchanged.
+
+    :param config_file_path: Path to YAML configuration file
+    :param file_state: File mtime and size, as computed by _config_source_key
+    :return: The parsed YAML document; callers must not modify it
+    """
+    with open(config_file_path, 'rb') as f:
+        return _parse_yaml_content(f.read())
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml_content(content: bytes) -> Any:
+    """
+    Parse YAML file contents, reusing the result for identical contents.
+
+    A file that is rewritten or touched without changing its contents gets a new
+    mtime, but is not parsed again.
+
+    :param content: Raw file contents
+    :return: The parsed YAML document; callers must not modify it
+    """
+    import yaml
+
+    # Prefer the libyaml C loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return yaml.load(content, Loader=loader)
+
 
 def load_index_filter_config(config_file_path: str = '') -> IndexFilterConfig:
     """
@@ -120,57 +521,60 @@ def load_index_filter_config(config_file_path: str = '') -> IndexFilterConfig:
     1. YAML configuration file (if provided)
     2. Environment variables
 
+    If neither the file nor the environment variables changed since the last load,
+    the previously loaded instance is reused without parsing or compiling anything.
+
     :param config_file_path: Path to YAML configuration file
     :return: IndexFilterConfig instance
     """
-    global _index_filter_config
+    global _index_filter_config, _loaded_index_filter_config
+
+    source_key = _config_source_key(config_file_path)
+    if _loaded_index_filter_config is not None and _loaded_index_filter_config[0] == source_key:
+        config = _loaded_index_filter_config[1]
+        if config is not _index_filter_config:
+            _index_filter_config = config
+            clear_response_cache()
+        return config
 
-    allowed_patterns = []
-    denied_patterns = []
+    allowed_patterns: List[str] = []
+    denied_patterns: List[str] = []
 
     # Load from YAML file first
     if config_file_path:
         try:
-            with open(config_file_path, 'r') as f:
-                config = yaml.safe_load(f)
-                if config and 'index_security' in config:
-                    security_config = config['index_security']
-                    allowed_patterns = security_config.get('allowed_index_patterns', [])
-                    denied_patterns = security_config.get('denied_index_patterns', [])
-                    logging.info(f'Loaded index filter config from {config_file_path}')
+            config = _parse_yaml(config_file_path, source_key[1])
+            if config and 'index_security' in config:
+                security_config = config['index_security']
+                allowed_patterns = security_config.get('allowed_index_patterns', [])
+                denied_patterns = security_config.get('denied_index_patterns', [])
+                logging.info(f'Loaded index filter config from {config_file_path}')
         except Exception as e:
             logging.error(f'Error loading index filter config from file: {e}')
 
     # Load from environment variables (only if not loaded from file)
     if not allowed_patterns and not denied_patterns:
-        allowed_env = os.getenv('OPENSEARCH_ALLOWED_INDEX_PATTERNS', '')
-        denied_env = os.getenv('OPENSEARCH_DENIED_INDEX_PATTERNS', '')
-
-        if allowed_env:
-            try:
-                # Support both JSON array and comma-separated list
-                if allowed_env.strip().startswith('['):
-                    allowed_patterns = json.loads(allowed_env)
-                else:
-                    allowed_patterns = [p.strip() for p in allowed_env.split(',') if p.strip()]
-                logging.info(f'Loaded allowed index patterns from environment: {allowed_patterns}')
-            except json.JSONDecodeError as e:
-                logging.error(f'Error parsing OPENSEARCH_ALLOWED_INDEX_PATTERNS: {e}')
-
-        if denied_env:
-            try:
-                # Support both JSON array and comma-separated list
-                if denied_env.strip().startswith('['):
-                    denied_patterns = json.loads(denied_env)
-                else:
-                    denied_patterns = [p.strip() for p in denied_env.split(',') if p.strip()]
-                logging.info(f'Loaded denied index patterns from environment: {denied_patterns}')
-            except json.JSONDecodeError as e:
-                logging.error(f'Error parsing OPENSEARCH_DENIED_INDEX_PATTERNS: {e}')
-
-    _index_filter_config = IndexFilterConfig(
-        allowed_index_patterns=allowed_patterns, denied_index_patterns=denied_patterns
-    )
+        # The variables were already read for the source key
+        _, _, allowed_env, denied_env = source_key
+        allowed_patterns = _parse_env_patterns('OPENSEARCH_ALLOWED_INDEX_PATTERNS', allowed_env)
+        denied_patterns = _parse_env_patterns('OPENSEARCH_DENIED_INDEX_PATTERNS', denied_env)
+
+    # Changed inputs that produce the same patterns keep the loaded instance,
+    # along with its decision cache and the cached responses
+    config = _loaded_index_filter_config[1] if _loaded_index_filter_config else None
+    if (
+        config is None
+        or config.allowed_index_patterns != allowed_patterns
+        or config.denied_index_patterns != denied_patterns
+    ):
+        config = IndexFilterConfig(
+            allowed_index_patterns=allowed_patterns, denied_index_patterns=denied_patterns
+        )
+    _loaded_index_filter_config = (source_key, config)
+    if config is not _index_filter_config:
+        _index_filter_config = config
+        # Cached responses may have been fetched under the previous index filters
+        clear_response_cache()
 
     return _index_filter_config
 
@@ -200,6 +604,9 @@ def validate_index_access(index_name: str) -> None:
         return
 
     config = get_index_filter_config()
+    if config._empty:
+        return
+
     is_allowed, reason = config.is_index_allowed(index_name)
 
     if not is_allowed:
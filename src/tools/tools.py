@@ -1,7 +1,10 @@
 # Copyright OpenSearch Contributors
 # SPDX-License-Identifier: Apache-2.0
 
-import json
+import asyncio
+import functools
+from operator import itemgetter
+from typing import Any, Callable
 from .tool_params import (
     GetAllocationArgs,
     GetClusterStateArgs,
@@ -20,7 +23,7 @@ from .tool_params import (
     baseToolArgs,
 )
 from .utils import is_tool_compatible
-from .index_filter import validate_index_access
+from .index_filter import get_index_filter_config, validate_index_access
 from opensearch.helper import (
     get_allocation,
     get_cluster_state,
@@ -39,23 +42,102 @@ from opensearch.helper import (
     list_indices,
     search_index,
 )
+from opensearch.serialization import dumps_indented
+
+
+def _response_error(result):
+    """Return the error reported in a helper result, or None if there is none."""
+    return result.get('error') if isinstance(result, dict) else None
+
+
+# Bodies longer than this many characters are split across several text items
+RESPONSE_CHUNK_SIZE = 256 * 1024
+
+
+def _text_response(message: str, body: str) -> list[dict]:
+    """Build an MCP text response, splitting a large body into several text items.
+
+    Args:
+        message: Description of the body, shown before it
+        body: Formatted tool output
+
+    Returns:
+        list[dict]: One text item, or the message followed by chunks of the body
+    """
+    if len(body) <= RESPONSE_CHUNK_SIZE:
+        return [{'type': 'text', 'text': f'{message}:\n{body}'}]
+    return [{'type': 'text', 'text': f'{message}:'}] + [
+        {'type': 'text', 'text': body[start : start + RESPONSE_CHUNK_SIZE]}
+        for start in range(0, len(body), RESPONSE_CHUNK_SIZE)
+    ]
+
+
+@functools.lru_cache(maxsize=256)
+def _is_version_compatible(opensearch_version, min_version: str, max_version: str) -> bool:
+    """Memoized is_tool_compatible for a version and a tool's version bounds."""
+    return is_tool_compatible(
+        opensearch_version, {'min_version': min_version, 'max_version': max_version}
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _supported_versions(min_version: str, max_version: str) -> str | None:
+    """Describe a tool's supported version range, or None if it is unbounded."""
+    if min_version and max_version:
+        return f'{min_version} to {max_version}'
+    if min_version:
+        return f'{min_version} or later'
+    if max_version:
+        return f'up to {max_version}'
+    return None
+
+
+# Header lines of the fixed-schema tables
+_SHARDS_HEADER = 'index | shard | prirep | state | docs | store | ip | node\n'
+_SEGMENTS_COLUMNS = (
+    'index', 'shard', 'prirep', 'segment', 'generation', 'docs.count', 'docs.deleted', 'size',
+    'memory.bookkeeping', 'memory.vectors', 'memory.docvalues', 'memory.terms', 'version',
+)
+_SEGMENTS_HEADER = ' | '.join(_SEGMENTS_COLUMNS) + '\n'
+
+
+@functools.lru_cache(maxsize=8)
+def _table_header(columns: tuple[str, ...]) -> str:
+    """Build the header line of a table with the given columns."""
+    return ' | '.join(columns) + '\n'
+
+
+@functools.lru_cache(maxsize=8)
+def _row_getter(columns: tuple[str, ...]) -> tuple[dict, itemgetter]:
+    """Build the 'N/A' defaults and the value getter for rows of the given columns."""
+    return dict.fromkeys(columns, 'N/A'), itemgetter(*columns)
+
+
+def _format_rows(rows: list[dict], columns: tuple[str, ...]) -> str:
+    """Format rows as ' | ' separated lines, using 'N/A' for missing columns."""
+    if not columns:
+        return '\n' * len(rows)
+    defaults, getter = _row_getter(columns)
+    if len(columns) == 1:
+        # itemgetter returns a bare value rather than a tuple for a single column
+        return ''.join(f'{getter({**defaults, **row})}\n' for row in rows)
+    return ''.join(' | '.join(map(str, getter({**defaults, **row}))) + '\n' for row in rows)
 
 
 def check_tool_compatibility(tool_name: str, args: baseToolArgs = None):
     opensearch_version = get_opensearch_version(args)
-    if not is_tool_compatible(opensearch_version, TOOL_REGISTRY[tool_name]):
-        tool_display_name = TOOL_REGISTRY[tool_name].get('display_name', tool_name)
-        min_version = TOOL_REGISTRY[tool_name].get('min_version', '')
-        max_version = TOOL_REGISTRY[tool_name].get('max_version', '')
-
-        version_info = (
-            f'{min_version} to {max_version}'
-            if min_version and max_version
-            else f'{min_version} or later'
-            if min_version
-            else f'up to {max_version}'
-            if max_version
-            else None
+    # Without a known version (e.g. serverless) every tool is treated as compatible
+    if not opensearch_version:
+        return
+    tool_info = TOOL_REGISTRY[tool_name]
+    if not _is_version_compatible(
+        opensearch_version,
+        tool_info.get('min_version', '0.0.0'),
+        tool_info.get('max_version', '99.99.99'),
+    ):
+        tool_display_name = tool_info.get('display_name', tool_name)
+        version_info = _supported_versions(
+            tool_info.get('min_version', ''), tool_info.get('max_version', '')
         )
 
         error_message = f"Tool '{tool_display_name}' is not supported for this OpenSearch version (current version: {opensearch_version})."
@@ -65,9 +147,42 @@ def check_tool_compatibility(tool_name: str, args: baseToolArgs = None):
         raise Exception(error_message)
 
 
+def _json_tool(
+    tool_name: str,
+    helper: Callable,
+    describe: Callable[[Any], str],
+    error_message: str,
+    validate_index: bool = True,
+) -> Callable:
+    """Build a tool that returns a helper's response as formatted JSON.
+
+    Args:
+        tool_name: TOOL_REGISTRY key used for the compatibility check
+        helper: Helper function performing the REST call
+        describe: Builds the message shown before the response from the tool arguments
+        error_message: Message prefix returned when the call fails
+        validate_index: Whether args.index is checked against the index filters
+
+    Returns:
+        Callable: Async tool function taking the tool arguments, in MCP format
+    """
+
+    async def tool(args) -> list[dict]:
+        try:
+            await asyncio.to_thread(check_tool_compatibility, tool_name, args)
+            if validate_index:
+                validate_index_access(args.index)
+            result = await asyncio.to_thread(helper, args)
+            return _text_response(describe(args), dumps_indented(result))
+        except Exception as e:
+            return [{'type': 'text', 'text': f'{error_message}: {str(e)}'}]
+
+    return tool
+
+
 async def list_indices_tool(args: ListIndicesArgs) -> list[dict]:
     try:
-        check_tool_compatibility('ListIndexTool', args)
+        await asyncio.to_thread(check_tool_compatibility, 'ListIndexTool', args)
 
         # Validate index access if index parameter is provided
         if args.index:
@@ -75,22 +190,21 @@ async def list_indices_tool(args: ListIndicesArgs) -> list[dict]:
 
         # If index is provided, always return detailed information for that specific index
         if args.index:
-            index_info = get_index(args)
-            formatted_info = json.dumps(index_info, indent=2)
+            index_info = await asyncio.to_thread(get_index, args)
+            formatted_info = dumps_indented(index_info)
             return [
                 {'type': 'text', 'text': f'Index information for {args.index}:\n{formatted_info}'}
             ]
 
         # When no specific index is provided, use allowed index patterns if configured
-        from .index_filter import get_index_filter_config
         filter_config = get_index_filter_config()
         if filter_config.allowed_index_patterns:
             # Set args.index to comma-separated list of allowed patterns
             # This leverages OpenSearch's native pattern matching
-            args.index = ','.join(filter_config.allowed_index_patterns)
+            args.index = filter_config.allowed_index_expression
 
         # List indices (filtered by allowed patterns if configured)
-        indices = list_indices(args)
+        indices = await asyncio.to_thread(list_indices, args)
 
         # If include_detail is False, return only pure list of index names
         if not args.include_detail:
@@ -99,99 +213,70 @@ async def list_indices_tool(args: ListIndicesArgs) -> list[dict]:
                 for item in indices
                 if isinstance(item, dict) and 'index' in item
             ]
-            formatted_names = json.dumps(index_names, indent=2)
+            formatted_names = dumps_indented(index_names)
             return [{'type': 'text', 'text': f'Indices:\n{formatted_names}'}]
 
         # include_detail is True: return full information
-        formatted_indices = json.dumps(indices, indent=2)
+        formatted_indices = dumps_indented(indices)
         return [{'type': 'text', 'text': f'All indices information:\n{formatted_indices}'}]
     except Exception as e:
         return [{'type': 'text', 'text': f'Error listing indices: {str(e)}'}]
 
 
-async def get_index_mapping_tool(args: GetIndexMappingArgs) -> list[dict]:
-    try:
-        check_tool_compatibility('IndexMappingTool', args)
-        validate_index_access(args.index)
-        mapping = get_index_mapping(args)
-        formatted_mapping = json.dumps(mapping, indent=2)
-
-        return [{'type': 'text', 'text': f'Mapping for {args.index}:\n{formatted_mapping}'}]
-    except Exception as e:
-        return [{'type': 'text', 'text': f'Error getting mapping: {str(e)}'}]
+get_index_mapping_tool = _json_tool(
+    'IndexMappingTool',
+    get_index_mapping,
+    lambda args: f'Mapping for {args.index}',
+    'Error getting mapping',
+)
 
 
-async def search_index_tool(args: SearchIndexArgs) -> list[dict]:
-    try:
-        check_tool_compatibility('SearchIndexTool', args)
-        validate_index_access(args.index)
-        result = search_index(args)
-        formatted_result = json.dumps(result, indent=2)
-
-        return [
-            {
-                'type': 'text',
-                'text': f'Search results from {args.index}:\n{formatted_result}',
-            }
-        ]
-    except Exception as e:
-        return [{'type': 'text', 'text': f'Error searching index: {str(e)}'}]
+search_index_tool = _json_tool(
+    'SearchIndexTool',
+    search_index,
+    lambda args: f'Search results from {args.index}',
+    'Error searching index',
+)
 
 
 async def get_shards_tool(args: GetShardsArgs) -> list[dict]:
     try:
-        check_tool_compatibility('GetShardsTool', args)
+        await asyncio.to_thread(check_tool_compatibility, 'GetShardsTool', args)
         validate_index_access(args.index)
-        result = get_shards(args)
-
-        if isinstance(result, dict) and 'error' in result:
-            return [{'type': 'text', 'text': f'Error getting shards: {result["error"]}'}]
-        formatted_text = 'index | shard | prirep | state | docs | store | ip | node\n'
-
-        # Format each shard row
-        for shard in result:
-            formatted_text += f'{shard["index"]} | '
-            formatted_text += f'{shard["shard"]} | '
-            formatted_text += f'{shard["prirep"]} | '
-            formatted_text += f'{shard["state"]} | '
-            formatted_text += f'{shard["docs"]} | '
-            formatted_text += f'{shard["store"]} | '
-            formatted_text += f'{shard["ip"]} | '
-            formatted_text += f'{shard["node"]}\n'
+        result = await asyncio.to_thread(get_shards, args)
+
+        if (error := _response_error(result)) is not None:
+            return [{'type': 'text', 'text': f'Error getting shards: {error}'}]
+        formatted_text = _SHARDS_HEADER
+
+        # Format each shard row and join them once
+        formatted_text += ''.join(
+            f'{shard["index"]} | {shard["shard"]} | {shard["prirep"]} | {shard["state"]} | '
+            f'{shard["docs"]} | {shard["store"]} | {shard["ip"]} | {shard["node"]}\n'
+            for shard in result
+        )
 
         return [{'type': 'text', 'text': formatted_text}]
     except Exception as e:
         return [{'type': 'text', 'text': f'Error getting shards information: {str(e)}'}]
 
 
-async def get_cluster_state_tool(args: GetClusterStateArgs) -> list[dict]:
-    """Tool to get the current state of the cluster.
+def _describe_cluster_state(args: GetClusterStateArgs) -> str:
+    """Describe the cluster state that was requested."""
+    message = 'Cluster state information'
+    if args.metric:
+        message += f' for metric: {args.metric}'
+    if args.index:
+        message += f', filtered by index: {args.index}'
+    return message
 
-    Args:
-        args: GetClusterStateArgs containing optional metric and index filters
 
-    Returns:
-        list[dict]: Cluster state information in MCP format
-    """
-    try:
-        check_tool_compatibility('GetClusterStateTool', args)
-        if args.index:
-            validate_index_access(args.index)
-        result = get_cluster_state(args)
-        
-        # Format the response for better readability
-        formatted_result = json.dumps(result, indent=2)
-        
-        # Create response message based on what was requested
-        message = "Cluster state information"
-        if args.metric:
-            message += f" for metric: {args.metric}"
-        if args.index:
-            message += f", filtered by index: {args.index}"
-            
-        return [{'type': 'text', 'text': f'{message}:\n{formatted_result}'}]
-    except Exception as e:
-        return [{'type': 'text', 'text': f'Error getting cluster state: {str(e)}'}]
+get_cluster_state_tool = _json_tool(
+    'GetClusterStateTool',
+    get_cluster_state,
+    _describe_cluster_state,
+    'Error getting cluster state',
+)
 
 
 async def get_segments_tool(args: GetSegmentsArgs) -> list[dict]:
@@ -204,32 +289,19 @@ async def get_segments_tool(args: GetSegmentsArgs) -> list[dict]:
         list[dict]: Segment information in MCP format
     """
     try:
-        check_tool_compatibility('GetSegmentsTool', args)
+        await asyncio.to_thread(check_tool_compatibility, 'GetSegmentsTool', args)
         if args.index:
             validate_index_access(args.index)
-        result = get_segments(args)
+        result = await asyncio.to_thread(get_segments, args)
         
-        if isinstance(result, dict) and 'error' in result:
-            return [{'type': 'text', 'text': f'Error getting segments: {result["error"]}'}]
+        if (error := _response_error(result)) is not None:
+            return [{'type': 'text', 'text': f'Error getting segments: {error}'}]
         
         # Create a formatted table for better readability
-        formatted_text = 'index | shard | prirep | segment | generation | docs.count | docs.deleted | size | memory.bookkeeping | memory.vectors | memory.docvalues | memory.terms | version\n'
+        formatted_text = _SEGMENTS_HEADER
         
         # Format each segment row
-        for segment in result:
-            formatted_text += f'{segment.get("index", "N/A")} | '
-            formatted_text += f'{segment.get("shard", "N/A")} | '
-            formatted_text += f'{segment.get("prirep", "N/A")} | '
-            formatted_text += f'{segment.get("segment", "N/A")} | '
-            formatted_text += f'{segment.get("generation", "N/A")} | '
-            formatted_text += f'{segment.get("docs.count", "N/A")} | '
-            formatted_text += f'{segment.get("docs.deleted", "N/A")} | '
-            formatted_text += f'{segment.get("size", "N/A")} | '
-            formatted_text += f'{segment.get("memory.bookkeeping", "N/A")} | '
-            formatted_text += f'{segment.get("memory.vectors", "N/A")} | '
-            formatted_text += f'{segment.get("memory.docvalues", "N/A")} | '
-            formatted_text += f'{segment.get("memory.terms", "N/A")} | '
-            formatted_text += f'{segment.get("version", "N/A")}\n'
+        formatted_text += _format_rows(result, _SEGMENTS_COLUMNS)
         
         # Create response message based on what was requested
         message = "Segment information"
@@ -253,28 +325,24 @@ async def cat_nodes_tool(args: CatNodesArgs) -> list[dict]:
         list[dict]: Node information in MCP format
     """
     try:
-        check_tool_compatibility('CatNodesTool', args)
-        result = get_nodes(args)
+        await asyncio.to_thread(check_tool_compatibility, 'CatNodesTool', args)
+        result = await asyncio.to_thread(get_nodes, args)
         
-        if isinstance(result, dict) and 'error' in result:
-            return [{'type': 'text', 'text': f'Error getting nodes: {result["error"]}'}]
+        if (error := _response_error(result)) is not None:
+            return [{'type': 'text', 'text': f'Error getting nodes: {error}'}]
         
         # If no nodes found
         if not result:
             return [{'type': 'text', 'text': 'No nodes found in the cluster.'}]
         
         # Get all available columns from the first node
-        columns = list(result[0].keys())
+        columns = tuple(result[0].keys())
         
         # Create a formatted table header
-        formatted_text = ' | '.join(columns) + '\n'
+        formatted_text = _table_header(columns)
         
         # Format each node row
-        for node in result:
-            row_values = []
-            for col in columns:
-                row_values.append(str(node.get(col, 'N/A')))
-            formatted_text += ' | '.join(row_values) + '\n'
+        formatted_text += _format_rows(result, columns)
         
         # Create response message based on what was requested
         message = "Node information for the cluster"
@@ -286,80 +354,37 @@ async def cat_nodes_tool(args: CatNodesArgs) -> list[dict]:
         return [{'type': 'text', 'text': f'Error getting node information: {str(e)}'}]
 
 
-async def get_index_info_tool(args: GetIndexInfoArgs) -> list[dict]:
-    """Tool to get detailed information about an index including mappings, settings, and aliases.
-
-    Args:
-        args: GetIndexInfoArgs containing the index name
-
-    Returns:
-        list[dict]: Index information in MCP format
-    """
-    try:
-        check_tool_compatibility('GetIndexInfoTool', args)
-        validate_index_access(args.index)
-        result = get_index_info(args)
-        
-        # Format the response for better readability
-        formatted_result = json.dumps(result, indent=2)
-        
-        # Create response message
-        message = f"Detailed information for index: {args.index}"
-        
-        return [{'type': 'text', 'text': f'{message}:\n{formatted_result}'}]
-    except Exception as e:
-        return [{'type': 'text', 'text': f'Error getting index information: {str(e)}'}]
+get_index_info_tool = _json_tool(
+    'GetIndexInfoTool',
+    get_index_info,
+    lambda args: f'Detailed information for index: {args.index}',
+    'Error getting index information',
+)
 
 
-async def get_index_stats_tool(args: GetIndexStatsArgs) -> list[dict]:
-    """Tool to get statistics about an index.
+def _describe_index_stats(args: GetIndexStatsArgs) -> str:
+    """Describe the index statistics that were requested."""
+    message = f'Statistics for index: {args.index}'
+    if args.metric:
+        message += f' (metrics: {args.metric})'
+    return message
 
-    Args:
-        args: GetIndexStatsArgs containing the index name and optional metric filter
 
-    Returns:
-        list[dict]: Index statistics in MCP format
-    """
-    try:
-        check_tool_compatibility('GetIndexStatsTool', args)
-        validate_index_access(args.index)
-        result = get_index_stats(args)
-        
-        # Format the response for better readability
-        formatted_result = json.dumps(result, indent=2)
-        
-        # Create response message based on what was requested
-        message = f"Statistics for index: {args.index}"
-        if args.metric:
-            message += f" (metrics: {args.metric})"
-        
-        return [{'type': 'text', 'text': f'{message}:\n{formatted_result}'}]
-    except Exception as e:
-        return [{'type': 'text', 'text': f'Error getting index statistics: {str(e)}'}]
+get_index_stats_tool = _json_tool(
+    'GetIndexStatsTool',
+    get_index_stats,
+    _describe_index_stats,
+    'Error getting index statistics',
+)
 
 
-async def get_query_insights_tool(args: GetQueryInsightsArgs) -> list[dict]:
-    """Tool to get query insights from the /_insights/top_queries endpoint.
-    
-    Args:
-        args: GetQueryInsightsArgs containing connection parameters
-        
-    Returns:
-        list[dict]: Query insights in MCP format
-    """
-    try:
-        check_tool_compatibility('GetQueryInsightsTool', args)
-        result = get_query_insights(args)
-        
-        # Format the response for better readability
-        formatted_result = json.dumps(result, indent=2)
-        
-        # Create simple response message
-        message = "Query insights from /_insights/top_queries endpoint"
-        
-        return [{'type': 'text', 'text': f'{message}:\n{formatted_result}'}]
-    except Exception as e:
-        return [{'type': 'text', 'text': f'Error getting query insights: {str(e)}'}]
+get_query_insights_tool = _json_tool(
+    'GetQueryInsightsTool',
+    get_query_insights,
+    lambda args: 'Query insights from /_insights/top_queries endpoint',
+    'Error getting query insights',
+    validate_index=False,
+)
 
 
 async def get_nodes_hot_threads_tool(args: GetNodesHotThreadsArgs) -> list[dict]:
@@ -372,8 +397,8 @@ async def get_nodes_hot_threads_tool(args: GetNodesHotThreadsArgs) -> list[dict]
         list[dict]: Hot threads information in MCP format
     """
     try:
-        check_tool_compatibility('GetNodesHotThreadsTool', args)
-        result = get_nodes_hot_threads(args)
+        await asyncio.to_thread(check_tool_compatibility, 'GetNodesHotThreadsTool', args)
+        result = await asyncio.to_thread(get_nodes_hot_threads, args)
         
         # Create simple response message
         message = "Hot threads information from /_nodes/hot_threads endpoint"
@@ -394,28 +419,24 @@ async def get_allocation_tool(args: GetAllocationArgs) -> list[dict]:
         list[dict]: Allocation information in MCP format
     """
     try:
-        check_tool_compatibility('GetAllocationTool', args)
-        result = get_allocation(args)
+        await asyncio.to_thread(check_tool_compatibility, 'GetAllocationTool', args)
+        result = await asyncio.to_thread(get_allocation, args)
         
-        if isinstance(result, dict) and 'error' in result:
-            return [{'type': 'text', 'text': f'Error getting allocation information: {result["error"]}'}]
+        if (error := _response_error(result)) is not None:
+            return [{'type': 'text', 'text': f'Error getting allocation information: {error}'}]
         
         # If no allocation information found
         if not result:
             return [{'type': 'text', 'text': 'No allocation information found in the cluster.'}]
         
         # Get all available columns from the first allocation entry
-        columns = list(result[0].keys())
+        columns = tuple(result[0].keys())
         
         # Create a formatted table header
-        formatted_text = ' | '.join(columns) + '\n'
+        formatted_text = _table_header(columns)
         
         # Format each allocation row
-        for allocation in result:
-            row_values = []
-            for col in columns:
-                row_values.append(str(allocation.get(col, 'N/A')))
-            formatted_text += ' | '.join(row_values) + '\n'
+        formatted_text += _format_rows(result, columns)
         
         # Create simple response message
         message = "Allocation information from /_cat/allocation endpoint"
@@ -435,14 +456,14 @@ async def get_nodes_tool(args: GetNodesArgs) -> list[dict]:
         list[dict]: Detailed node information in MCP format
     """
     try:
-        check_tool_compatibility('GetNodesTool', args)
-        result = get_nodes_info(args)
+        await asyncio.to_thread(check_tool_compatibility, 'GetNodesTool', args)
+        result = await asyncio.to_thread(get_nodes_info, args)
         
-        if isinstance(result, dict) and 'error' in result:
-            return [{'type': 'text', 'text': f'Error getting nodes information: {result["error"]}'}]
+        if (error := _response_error(result)) is not None:
+            return [{'type': 'text', 'text': f'Error getting nodes information: {error}'}]
         
         # Format the response for better readability
-        formatted_result = json.dumps(result, indent=2)
+        formatted_result = dumps_indented(result)
         
         # Create response message based on what was requested
         message = "Detailed node information"
@@ -454,7 +475,7 @@ async def get_nodes_tool(args: GetNodesArgs) -> list[dict]:
         if args.metric:
             message += f" (metrics: {args.metric})"
         
-        return [{'type': 'text', 'text': f'{message}:\n{formatted_result}'}]
+        return _text_response(message, formatted_result)
     except Exception as e:
         return [{'type': 'text', 'text': f'Error getting nodes information: {str(e)}'}]
 
@@ -469,28 +490,24 @@ async def get_long_running_tasks_tool(args: GetLongRunningTasksArgs) -> list[dic
         list[dict]: Long-running tasks information in MCP format
     """
     try:
-        check_tool_compatibility('GetLongRunningTasksTool', args)
-        result = get_long_running_tasks(args)
+        await asyncio.to_thread(check_tool_compatibility, 'GetLongRunningTasksTool', args)
+        result = await asyncio.to_thread(get_long_running_tasks, args)
         
-        if isinstance(result, dict) and 'error' in result:
-            return [{'type': 'text', 'text': f'Error getting long-running tasks: {result["error"]}'}]
+        if (error := _response_error(result)) is not None:
+            return [{'type': 'text', 'text': f'Error getting long-running tasks: {error}'}]
         
         # If no tasks found
         if not result:
             return [{'type': 'text', 'text': 'No tasks found in the cluster.'}]
         
         # Get all available columns from the first task entry
-        columns = list(result[0].keys())
+        columns = tuple(result[0].keys())
         
         # Create a formatted table header
-        formatted_text = ' | '.join(columns) + '\n'
+        formatted_text = _table_header(columns)
         
         # Format each task row
-        for task in result:
-            row_values = []
-            for col in columns:
-                row_values.append(str(task.get(col, 'N/A')))
-            formatted_text += ' | '.join(row_values) + '\n'
+        formatted_text += _format_rows(result, columns)
         
         # Create response message based on what was requested
         message = f"Top {len(result)} long-running tasks sorted by running time"
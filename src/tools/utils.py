@@ -1,11 +1,18 @@
 # Copyright OpenSearch Contributors
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
 import logging
 import yaml
 from semver import Version
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_tool_version(version: str) -> Version:
+    """Parse a tool's min or max version once; the same few strings recur on every check."""
+    return Version.parse(version, optional_minor_and_patch=True)
+
+
 def is_tool_compatible(current_version: Version | None, tool_info: dict = {}):
     """Check if a tool is compatible with the current OpenSearch version.
 
@@ -19,12 +26,8 @@ def is_tool_compatible(current_version: Version | None, tool_info: dict = {}):
     # Find a version equivalent in serverless mode
     if not current_version:
         return True
-    min_tool_version = Version.parse(
-        tool_info.get('min_version', '0.0.0'), optional_minor_and_patch=True
-    )
-    max_tool_version = Version.parse(
-        tool_info.get('max_version', '99.99.99'), optional_minor_and_patch=True
-    )
+    min_tool_version = _parse_tool_version(tool_info.get('min_version', '0.0.0'))
+    max_tool_version = _parse_tool_version(tool_info.get('max_version', '99.99.99'))
     return min_tool_version <= current_version <= max_tool_version
 
 
@@ -4,7 +4,8 @@
 import boto3
 import os
 import pytest
-from opensearch.client import initialize_client
+from opensearch.client import CONNECTION_POOL_MAXSIZE, clear_client_cache, initialize_client
+from opensearch.serialization import SERIALIZER
 from opensearchpy import RequestsHttpConnection
 from requests_aws4auth import AWS4Auth
 from tools.tool_params import baseToolArgs
@@ -14,6 +15,7 @@ from unittest.mock import Mock, patch
 class TestOpenSearchClient:
     def setup_method(self):
         """Setup that runs before each test method."""
+        clear_client_cache()
         # Clear any existing environment variables
         self.original_env = {}
         for key in [
@@ -67,6 +69,8 @@ class TestOpenSearchClient:
             use_ssl=True,
             verify_certs=True,
             connection_class=RequestsHttpConnection,
+            pool_maxsize=32,
+            serializer=SERIALIZER,
             http_auth=('test-user', 'test-password'),
         )
 
@@ -167,6 +171,8 @@ class TestOpenSearchClient:
             use_ssl=True,
             verify_certs=True,
             connection_class=RequestsHttpConnection,
+            pool_maxsize=32,
+            serializer=SERIALIZER,
         )
 
     @patch('opensearch.client.initialize_client_with_cluster')
@@ -204,3 +210,85 @@ class TestOpenSearchClient:
         assert client == mock_client
         call_kwargs = mock_opensearch.call_args[1]
         assert call_kwargs['timeout'] == 60
+
+    @patch('opensearch.client.OpenSearch')
+    def test_initialize_client_pool_maxsize_env(self, mock_opensearch, monkeypatch):
+        """Test that OPENSEARCH_POOL_MAXSIZE overrides the connection pool size."""
+        os.environ['OPENSEARCH_URL'] = 'https://test-opensearch-domain.com'
+        os.environ['OPENSEARCH_NO_AUTH'] = 'true'
+        monkeypatch.setenv('OPENSEARCH_POOL_MAXSIZE', '64')
+
+        initialize_client(baseToolArgs())
+        assert mock_opensearch.call_args.kwargs['pool_maxsize'] == 64
+
+    @patch('opensearch.client.OpenSearch')
+    def test_initialize_client_pool_maxsize_not_a_number(
+        self, mock_opensearch, monkeypatch, caplog
+    ):
+        """Test that a non-numeric OPENSEARCH_POOL_MAXSIZE falls back to the default."""
+        os.environ['OPENSEARCH_URL'] = 'https://test-opensearch-domain.com'
+        os.environ['OPENSEARCH_NO_AUTH'] = 'true'
+        monkeypatch.setenv('OPENSEARCH_POOL_MAXSIZE', 'many')
+
+        initialize_client(baseToolArgs())
+        assert mock_opensearch.call_args.kwargs['pool_maxsize'] == CONNECTION_POOL_MAXSIZE
+        assert 'Invalid OPENSEARCH_POOL_MAXSIZE "many"' in caplog.text
+
+    @patch('opensearch.client.OpenSearch')
+    def test_initialize_client_pool_maxsize_not_positive(
+        self, mock_opensearch, monkeypatch, caplog
+    ):
+        """Test that a zero or negative OPENSEARCH_POOL_MAXSIZE falls back to the default."""
+        os.environ['OPENSEARCH_URL'] = 'https://test-opensearch-domain.com'
+        os.environ['OPENSEARCH_NO_AUTH'] = 'true'
+        for value in ('0', '-4'):
+            clear_client_cache()
+            monkeypatch.setenv('OPENSEARCH_POOL_MAXSIZE', value)
+
+            initialize_client(baseToolArgs())
+            assert mock_opensearch.call_args.kwargs['pool_maxsize'] == CONNECTION_POOL_MAXSIZE
+            assert f'Invalid OPENSEARCH_POOL_MAXSIZE "{value}"' in caplog.text
+
+    @patch('opensearch.client.OpenSearch')
+    def test_initialize_client_reuses_cached_client(self, mock_opensearch, monkeypatch):
+        """Test that clients are reused for identical connection settings."""
+        os.environ['OPENSEARCH_URL'] = 'https://test-opensearch-domain.com'
+        os.environ['OPENSEARCH_NO_AUTH'] = 'true'
+        mock_opensearch.side_effect = [Mock(), Mock()]
+
+        first = initialize_client(baseToolArgs())
+        second = initialize_client(baseToolArgs())
+        assert first is second
+        mock_opensearch.assert_called_once()
+
+        # Changing a connection setting creates a new client
+        monkeypatch.setenv('OPENSEARCH_SSL_VERIFY', 'false')
+        third = initialize_client(baseToolArgs())
+        assert third is not first
+        assert mock_opensearch.call_count == 2
+
+    @patch('opensearch.client.OpenSearch')
+    @patch('opensearch.client.boto3.Session')
+    def test_initialize_client_iam_role_not_cached(self, mock_session, mock_opensearch):
+        """Test that clients using assumed IAM role credentials are not cached."""
+        from mcp_server_opensearch.clusters_information import ClusterInfo
+        from opensearch.client import initialize_client_with_cluster
+
+        cluster_info = ClusterInfo(
+            opensearch_url='https://localhost:9200',
+            iam_arn='arn:aws:iam::123456789012:role/test-role',
+            aws_region='us-west-2',
+        )
+        mock_session.return_value.client.return_value.assume_role.return_value = {
+            'Credentials': {
+                'AccessKeyId': 'test-access-key',
+                'SecretAccessKey': 'test-secret-key',
+                'SessionToken': 'test-token',
+            }
+        }
+        mock_opensearch.side_effect = [Mock(), Mock()]
+
+        first = initialize_client_with_cluster(cluster_info)
+        second = initialize_client_with_cluster(cluster_info)
+        assert first is not second
+        assert mock_opensearch.call_count == 2
@@ -15,6 +15,11 @@ from unittest.mock import patch
 class TestOpenSearchHelper:
     def setup_method(self):
         """Setup that runs before each test method."""
+        from opensearch.helper import invalidate_version_cache
+        from opensearch.response_cache import clear_response_cache
+
+        clear_response_cache()
+        invalidate_version_cache()
         from opensearch.helper import (
             get_index_mapping,
             get_shards,
@@ -45,7 +50,7 @@ class TestOpenSearchHelper:
         # Assert
         assert result == mock_response
         mock_initialize_client.assert_called_once_with(ListIndicesArgs())
-        mock_client.cat.indices.assert_called_once_with(format='json')
+        mock_client.cat.indices.assert_called_once_with(format='json', h=None)
 
     @patch('opensearch.client.initialize_client')
     def test_get_index_mapping(self, mock_initialize_client):
@@ -106,6 +111,18 @@ class TestOpenSearchHelper:
         )
         mock_client.search.assert_called_once_with(index='test-index', body=test_query)
 
+    @patch('opensearch.client.initialize_client')
+    def test_get_nodes_hot_threads_not_cached(self, mock_initialize_client):
+        """Test that every hot threads call takes a new sample from the cluster."""
+        from opensearch.helper import get_nodes_hot_threads
+
+        mock_client = mock_initialize_client.return_value
+        mock_client.transport.perform_request.side_effect = ['sample 1', 'sample 2']
+
+        assert get_nodes_hot_threads(baseToolArgs()) == 'sample 1'
+        assert get_nodes_hot_threads(baseToolArgs()) == 'sample 2'
+        assert mock_client.transport.perform_request.call_count == 2
+
     @patch('opensearch.client.initialize_client')
     def test_get_shards(self, mock_initialize_client):
         """Test get_shards function."""
@@ -133,6 +150,30 @@ class TestOpenSearchHelper:
         mock_initialize_client.assert_called_once_with(GetShardsArgs(index='test-index'))
         mock_client.cat.shards.assert_called_once_with(index='test-index', format='json')
 
+    @patch('opensearch.client.initialize_client')
+    def test_get_cluster_state_filters_in_path(self, mock_initialize_client):
+        """Test that metric and index filters reach the /_cluster/state URL path."""
+        from opensearch.helper import get_cluster_state
+        from opensearchpy import OpenSearch
+        from tools.tool_params import GetClusterStateArgs
+
+        client = OpenSearch(hosts=['http://localhost:9200'])
+        mock_initialize_client.return_value = client
+        cases = [
+            (GetClusterStateArgs(), '/_cluster/state'),
+            (GetClusterStateArgs(metric='metadata'), '/_cluster/state/metadata'),
+            (
+                GetClusterStateArgs(metric='metadata,routing_table', index='logs-1'),
+                '/_cluster/state/metadata,routing_table/logs-1',
+            ),
+            # The server requires a metric before the index in the path
+            (GetClusterStateArgs(index='logs-1'), '/_cluster/state/_all/logs-1'),
+        ]
+        for args, expected_url in cases:
+            with patch.object(client.transport, 'perform_request', return_value={}) as request:
+                get_cluster_state(args)
+            assert request.call_args.args[:2] == ('GET', expected_url)
+
     @patch('opensearch.client.initialize_client')
     def test_list_indices_error(self, mock_initialize_client):
         """Test list_indices error handling."""
@@ -214,3 +255,46 @@ class TestOpenSearchHelper:
         # Execute and assert
         result = get_opensearch_version(args)
         assert result is None
+
+    @patch('opensearch.client.initialize_client')
+    def test_get_opensearch_version_cached_per_cluster(self, mock_initialize_client):
+        """Test that the version is fetched once per cluster until invalidated."""
+        from opensearch.helper import get_opensearch_version, invalidate_version_cache
+
+        mock_client = mock_initialize_client.return_value
+        mock_client.info.side_effect = [
+            {'version': {'number': '2.11.1'}},
+            {'version': {'number': '3.0.0'}},
+            {'version': {'number': '2.19.0'}},
+        ]
+        # Repeated calls for the same cluster reuse the cached version
+        assert str(get_opensearch_version(baseToolArgs())) == '2.11.1'
+        assert str(get_opensearch_version(baseToolArgs())) == '2.11.1'
+        # Other clusters are cached separately
+        assert (
+            str(get_opensearch_version(baseToolArgs(opensearch_cluster_name='other'))) == '3.0.0'
+        )
+        assert mock_client.info.call_count == 2
+
+        invalidate_version_cache()
+        assert str(get_opensearch_version(baseToolArgs())) == '2.19.0'
+        assert mock_client.info.call_count == 3
+
+    @patch('opensearch.client.initialize_client')
+    def test_get_opensearch_version_cache_expires(self, mock_initialize_client):
+        """Test that a cached version is fetched again once VERSION_CACHE_TTL has passed."""
+        from opensearch.helper import VERSION_CACHE_TTL, get_opensearch_version
+
+        mock_client = mock_initialize_client.return_value
+        mock_client.info.side_effect = [
+            {'version': {'number': '2.11.1'}},
+            {'version': {'number': '2.19.0'}},
+        ]
+        with patch('opensearch.helper.time.monotonic', return_value=100.0):
+            assert str(get_opensearch_version(baseToolArgs())) == '2.11.1'
+        with patch('opensearch.helper.time.monotonic', return_value=99.0 + VERSION_CACHE_TTL):
+            assert str(get_opensearch_version(baseToolArgs())) == '2.11.1'
+        # The cluster was upgraded after the cached version expired
+        with patch('opensearch.helper.time.monotonic', return_value=100.0 + VERSION_CACHE_TTL):
+            assert str(get_opensearch_version(baseToolArgs())) == '2.19.0'
+        assert mock_client.info.call_count == 2
@@ -0,0 +1,159 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from opensearch import response_cache
+from opensearch.response_cache import (
+    clear_response_cache,
+    freshness_lifetime,
+    ttl_cache,
+)
+from tools.tool_params import GetShardsArgs
+from unittest.mock import Mock, patch
+
+
+class TestResponseCache:
+    def setup_method(self):
+        """Setup that runs before each test method."""
+        clear_response_cache()
+
+    def teardown_method(self):
+        """Cleanup after each test method."""
+        clear_response_cache()
+
+    def test_freshness_lifetime_bounds(self):
+        """Test that the freshness lifetime is clamped to the policy bounds."""
+        assert freshness_lifetime('short', 0.1) == pytest.approx(5.1)
+        assert freshness_lifetime('short', 30.0) == 10.0
+        assert freshness_lifetime('normal', 0.1) == 10.0
+        assert freshness_lifetime('long', 0.1) == 30.0
+
+    def test_unknown_policy(self):
+        """Test that an unknown policy is rejected."""
+        with pytest.raises(ValueError):
+            ttl_cache('forever')
+
+    def test_cache_hit_and_expiry(self):
+        """Test that responses are reused until they expire."""
+        helper = Mock(side_effect=[['first'], ['second']])
+        helper.__qualname__ = 'helper'
+        cached_helper = ttl_cache('short')(helper)
+
+        with patch('opensearch.response_cache.time.monotonic', return_value=100.0):
+            assert cached_helper(GetShardsArgs(index='test-index')) == ['first']
+            assert cached_helper(GetShardsArgs(index='test-index')) == ['first']
+        assert helper.call_count == 1
+
+        # Different arguments are cached separately
+        with patch('opensearch.response_cache.time.monotonic', return_value=101.0):
+            assert cached_helper(GetShardsArgs(index='other-index')) == ['second']
+        assert helper.call_count == 2
+
+        helper.side_effect = [['third']]
+        with patch('opensearch.response_cache.time.monotonic', return_value=200.0):
+            assert cached_helper(GetShardsArgs(index='test-index')) == ['third']
+        assert helper.call_count == 3
+
+    def test_cache_key_includes_connection(self, monkeypatch):
+        """Test that responses from different clusters in single-cluster mode are not mixed."""
+        helper = Mock(side_effect=[['first'], ['second']])
+        helper.__qualname__ = 'helper'
+        cached_helper = ttl_cache('long')(helper)
+        args = GetShardsArgs(index='test-index')
+
+        monkeypatch.setenv('OPENSEARCH_URL', 'https://cluster-a:9200')
+        assert cached_helper(args) == ['first']
+        monkeypatch.setenv('OPENSEARCH_URL', 'https://cluster-b:9200')
+        assert cached_helper(args) == ['second']
+        monkeypatch.setenv('OPENSEARCH_URL', 'https://cluster-a:9200')
+        assert cached_helper(args) == ['first']
+        assert helper.call_count == 2
+
+    def test_cached_response_shared_between_callers(self):
+        """Test that cached responses are returned as is, without copying."""
+        response = {'shards': [{'index': 'test-index'}]}
+        helper = Mock(return_value=response)
+        helper.__qualname__ = 'helper'
+        cached_helper = ttl_cache('normal')(helper)
+        args = GetShardsArgs(index='test-index')
+
+        # Callers must not modify responses, since the same object is handed to all of them
+        assert cached_helper(args) is response
+        assert cached_helper(args) is response
+        assert helper.call_count == 1
+
+    def test_expired_response_evicted_on_lookup(self):
+        """Test that an expired response is dropped when it is looked up."""
+        helper = Mock(side_effect=[['first'], Exception('Test error')])
+        helper.__qualname__ = 'helper'
+        cached_helper = ttl_cache('short')(helper)
+        args = GetShardsArgs(index='test-index')
+
+        with patch('opensearch.response_cache.time.monotonic', return_value=100.0):
+            cached_helper(args)
+        assert len(response_cache._response_cache) == 1
+
+        # The expired response is gone even though refreshing it failed
+        with patch('opensearch.response_cache.time.monotonic', return_value=200.0):
+            with pytest.raises(Exception):
+                cached_helper(args)
+        assert len(response_cache._response_cache) == 0
+
+    def test_least_recently_used_evicted(self, monkeypatch):
+        """Test that the cache keeps at most MAX_CACHE_ENTRIES, evicting the least recently used."""
+        monkeypatch.setattr(response_cache, 'MAX_CACHE_ENTRIES', 2)
+        helper = Mock(side_effect=lambda args: [args.index])
+        helper.__qualname__ = 'helper'
+        cached_helper = ttl_cache('long')(helper)
+
+        with patch('opensearch.response_cache.time.monotonic', return_value=100.0):
+            cached_helper(GetShardsArgs(index='a'))
+            cached_helper(GetShardsArgs(index='b'))
+            # Using 'a' again makes 'b' the least recently used
+            cached_helper(GetShardsArgs(index='a'))
+            cached_helper(GetShardsArgs(index='c'))
+            assert helper.call_count == 3
+            assert len(response_cache._response_cache) == 2
+
+            cached_helper(GetShardsArgs(index='a'))
+            assert helper.call_count == 3
+            cached_helper(GetShardsArgs(index='b'))
+            assert helper.call_count == 4
+
+    def test_expired_responses_purged_on_store(self):
+        """Test that storing a response drops every expired one."""
+        helper = Mock(side_effect=lambda args: [args.index])
+        helper.__qualname__ = 'helper'
+        cached_helper = ttl_cache('short')(helper)
+
+        with patch('opensearch.response_cache.time.monotonic', return_value=100.0):
+            cached_helper(GetShardsArgs(index='a'))
+            cached_helper(GetShardsArgs(index='b'))
+        with patch('opensearch.response_cache.time.monotonic', return_value=200.0):
+            cached_helper(GetShardsArgs(index='c'))
+        assert len(response_cache._response_cache) == 1
+
+    def test_errors_and_none_not_cached(self):
+        """Test that exceptions and None responses are not cached."""
+        helper = Mock(side_effect=[Exception('Test error'), None, ['ok']])
+        helper.__qualname__ = 'helper'
+        cached_helper = ttl_cache('normal')(helper)
+        args = GetShardsArgs(index='test-index')
+
+        with pytest.raises(Exception):
+            cached_helper(args)
+        assert cached_helper(args) is None
+        assert cached_helper(args) == ['ok']
+        assert cached_helper(args) == ['ok']
+        assert helper.call_count == 3
+
+    def test_cache_disabled(self, monkeypatch):
+        """Test that OPENSEARCH_RESPONSE_CACHE=false bypasses the cache."""
+        monkeypatch.setenv('OPENSEARCH_RESPONSE_CACHE', 'false')
+        helper = Mock(return_value=['ok'])
+        helper.__qualname__ = 'helper'
+        cached_helper = ttl_cache('long')(helper)
+
+        cached_helper(GetShardsArgs(index='test-index'))
+        cached_helper(GetShardsArgs(index='test-index'))
+        assert helper.call_count == 2
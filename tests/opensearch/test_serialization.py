@@ -0,0 +1,41 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import math
+import pytest
+from opensearch.serialization import dumps_indented
+
+
+class TestOrjsonSerializer:
+    def setup_method(self):
+        """Setup that runs before each test method."""
+        pytest.importorskip('orjson')
+        from opensearch.serialization import OrjsonSerializer
+
+        self.serializer = OrjsonSerializer()
+
+    def test_round_trip(self):
+        """Test that documents survive a dumps/loads round trip."""
+        data = {'index': 'test-index', 'count': 3, 'nested': {'values': [1.5, None, True]}}
+        assert self.serializer.loads(self.serializer.dumps(data)) == data
+        assert self.serializer.dumps({'values': [1.5, None, True]}) == (
+            '{"values":[1.5,null,true]}'
+        )
+
+    def test_strings_are_not_serialized(self):
+        """Test that pre-serialized string bodies are passed through."""
+        assert self.serializer.dumps('{"query":{}}') == '{"query":{}}'
+
+    def test_falls_back_to_json(self):
+        """Test that values orjson rejects are handled like JSONSerializer."""
+        assert math.isnan(self.serializer.loads('{"value": NaN}')['value'])
+        assert self.serializer.dumps({'big': 2**70}) == '{"big":1180591620717411303424}'
+
+
+class TestDumpsIndented:
+    def test_matches_json_indent(self):
+        """Test that dumps_indented output matches json.dumps with indent=2."""
+        value = {'nodes': {'node-1': {'roles': ['data', 'ingest'], 'heap': 1.5}}, 1: None, 'e': {}}
+        assert dumps_indented(value) == json.dumps(value, indent=2)
+        assert dumps_indented({'big': 2**70}) == json.dumps({'big': 2**70}, indent=2)
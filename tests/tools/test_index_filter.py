@@ -1,17 +1,60 @@
 # Copyright OpenSearch Contributors
 # SPDX-License-Identifier: Apache-2.0
 
+import logging
 import os
 import pytest
-import tempfile
+import re
+import tools.index_filter
 import yaml
 from tools.index_filter import (
     IndexFilterConfig,
+    _compile_glob_alternation,
+    _parse_yaml,
+    _parse_yaml_content,
+    _translate_glob_re2,
     load_index_filter_config,
     validate_index_access,
 )
 
 
+# Prefer the libyaml C dumper when PyYAML was built with it
+SafeDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+class FakeRe2:
+    """Stand-in for the re2 module that records compiled patterns and rejects lookarounds."""
+
+    error = re.error
+
+    def __init__(self):
+        """Start with no compiled patterns."""
+        self.compiled = []
+
+    def compile(self, pattern):
+        """Compile like RE2 would, using re for the actual matching."""
+        if '(?!' in pattern or '(?=' in pattern:
+            raise self.error('invalid perl operator: (?!')
+        self.compiled.append(pattern)
+        return re.compile(pattern.replace('\\z', '\\Z'))
+
+
+@pytest.fixture(scope='session')
+def yaml_config_file(tmp_path_factory):
+    """Write each distinct configuration to a YAML file once per test session."""
+    config_files = {}
+
+    def make(config_data):
+        key = repr(config_data)
+        if key not in config_files:
+            path = tmp_path_factory.mktemp('config') / f'{len(config_files)}.yml'
+            path.write_text(yaml.dump(config_data, Dumper=SafeDumper))
+            config_files[key] = str(path)
+        return config_files[key]
+
+    return make
+
+
 class TestIndexFilterConfig:
     """Test IndexFilterConfig class."""
 
@@ -21,6 +64,8 @@ class TestIndexFilterConfig:
         is_allowed, reason = config.is_index_allowed('any-index')
         assert is_allowed is True
         assert reason is None
+        assert config.is_index_allowed('any-index,other-index') == (True, None)
+        assert config._cached_check.cache_info().currsize == 0
 
     def test_wildcard_allowed_pattern(self):
         """Test wildcard pattern in allowed list."""
@@ -84,6 +129,16 @@ class TestIndexFilterConfig:
         is_allowed, reason = config.is_index_allowed('logs-2024-1')
         assert is_allowed is False
 
+    def test_wildcard_and_regex_patterns_anchoring(self):
+        """Test that wildcards match whole names while regex patterns match from the start."""
+        config = IndexFilterConfig(allowed_index_patterns=['logs-*', 'regex:metrics', 'app-?'])
+
+        assert config.is_index_allowed('logs-web') == (True, None)
+        assert config.is_index_allowed('app-1') == (True, None)
+        assert config.is_index_allowed('metrics-cpu') == (True, None)
+        assert config.is_index_allowed('app-12')[0] is False
+        assert config.is_index_allowed('web-logs-1')[0] is False
+
     def test_regex_pattern_denied(self):
         """Test regex pattern in denied list."""
         config = IndexFilterConfig(denied_index_patterns=[r'regex:.*-dev-.*'])
@@ -97,6 +152,138 @@ class TestIndexFilterConfig:
         is_allowed, _ = config.is_index_allowed('app-prod-testing')
         assert is_allowed is True
 
+    def test_denied_reason_names_matching_pattern(self):
+        """Test that the denial reason reports the pattern that matched."""
+        config = IndexFilterConfig(
+            denied_index_patterns=['temp-*', r'regex:^(\w+)-\1$', r'regex:(?i)^secret', 'audit-?']
+        )
+
+        is_allowed, reason = config.is_index_allowed('audit-1')
+        assert is_allowed is False
+        assert reason.endswith('matches denied pattern: audit-?')
+
+        # Patterns with their own groups or global flags still match on their own
+        is_allowed, reason = config.is_index_allowed('dup-dup')
+        assert is_allowed is False
+        assert reason.endswith(r'matches denied pattern: regex:^(\w+)-\1$')
+
+        is_allowed, reason = config.is_index_allowed('SECRET-data')
+        assert is_allowed is False
+        assert reason.endswith('matches denied pattern: regex:(?i)^secret')
+
+        is_allowed, _ = config.is_index_allowed('dup-other')
+        assert is_allowed is True
+
+    def test_invalid_regex_pattern_never_matches(self):
+        """Test that an invalid regex pattern is skipped at load time and never matches."""
+        config = IndexFilterConfig(
+            allowed_index_patterns=['regex:logs-(', 'metrics-*'],
+            denied_index_patterns=['regex:[unclosed'],
+        )
+
+        is_allowed, _ = config.is_index_allowed('metrics-cpu')
+        assert is_allowed is True
+
+        is_allowed, reason = config.is_index_allowed('logs-(')
+        assert is_allowed is False
+        assert 'does not match any allowed patterns' in reason
+
+    def test_decision_cache_is_bounded(self, monkeypatch):
+        """Test that repeated checks are served from a bounded LRU cache."""
+        monkeypatch.setattr('tools.index_filter._DECISION_CACHE_MAXSIZE', 2)
+        config = IndexFilterConfig(denied_index_patterns=['sensitive-*'])
+
+        assert config.is_index_allowed('logs-a') == (True, None)
+        is_allowed, reason = config.is_index_allowed('sensitive-data')
+        assert is_allowed is False
+        assert config.is_index_allowed('sensitive-data') == (False, reason)
+        assert config._cached_check.cache_info().hits == 1
+
+        # Touch logs-a so that sensitive-data becomes least recently used
+        config.is_index_allowed('logs-a')
+        config.is_index_allowed('logs-b')
+        info = config._cached_check.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 3, 2)
+        config.is_index_allowed('sensitive-data')
+        assert config._cached_check.cache_info().misses == 4
+
+    def test_denied_reason_names_first_configured_pattern(self):
+        """Test that the first matching pattern in configuration order is reported."""
+        config = IndexFilterConfig(
+            denied_index_patterns=[
+                r'regex:(?i)^logs-sec',
+                'regex:^logs-\\w+$',
+                'logs-*-?',
+                'logs-*',
+                'logs-secret-a',
+            ]
+        )
+
+        # Every pattern matches; the unfused regex comes first in the configuration
+        is_allowed, reason = config.is_index_allowed('logs-secret-a')
+        assert is_allowed is False
+        assert reason.endswith('matches denied pattern: regex:(?i)^logs-sec')
+
+        # The fused regex is configured before the wildcard, prefix and literal patterns
+        _, reason = config.is_index_allowed('logs-web')
+        assert reason.endswith('matches denied pattern: regex:^logs-\\w+$')
+
+        # The wildcard pattern is configured before the prefix pattern
+        _, reason = config.is_index_allowed('logs-web-1')
+        assert reason.endswith('matches denied pattern: logs-*-?')
+
+        _, reason = config.is_index_allowed('logs-web-12')
+        assert reason.endswith('matches denied pattern: logs-*')
+
+        config = IndexFilterConfig(denied_index_patterns=['logs-*', 'regex:^logs-'])
+        _, reason = config.is_index_allowed('logs-web')
+        assert reason.endswith('matches denied pattern: logs-*')
+
+    def test_literal_index_names(self):
+        """Test patterns without wildcards that name a single index."""
+        config = IndexFilterConfig(
+            allowed_index_patterns=['orders', 'logs-*'], denied_index_patterns=['logs-audit']
+        )
+
+        assert config.is_index_allowed('orders') == (True, None)
+        assert config.is_index_allowed('logs-web') == (True, None)
+        is_allowed, reason = config.is_index_allowed('logs-audit')
+        assert is_allowed is False
+        assert reason.endswith('matches denied pattern: logs-audit')
+
+        # A literal name only matches itself
+        is_allowed, _ = config.is_index_allowed('orders-2024')
+        assert is_allowed is False
+
+    def test_prefix_patterns(self):
+        """Test trailing-wildcard patterns alongside other pattern kinds."""
+        config = IndexFilterConfig(
+            allowed_index_patterns=['metrics-*', 'orders', 'app-?-*'],
+            denied_index_patterns=['temp-*', 'metrics-secret*'],
+        )
+
+        assert config.is_index_allowed('metrics-cpu') == (True, None)
+        assert config.is_index_allowed('orders') == (True, None)
+        assert config.is_index_allowed('app-1-web') == (True, None)
+        is_allowed, reason = config.is_index_allowed('metrics-secret-keys')
+        assert is_allowed is False
+        assert reason.endswith('matches denied pattern: metrics-secret*')
+        assert config.is_index_allowed('temp-metrics')[0] is False
+        assert config.is_index_allowed('xmetrics-cpu')[0] is False
+
+    def test_denied_access_logged_on_every_check(self, caplog):
+        """Test that a denied index is logged again when served from the cache."""
+        config = IndexFilterConfig(denied_index_patterns=['secret-*'])
+
+        with caplog.at_level(logging.WARNING):
+            for _ in range(3):
+                assert config.is_index_allowed('secret-a')[0] is False
+        assert config._cached_check.cache_info().hits == 2
+        warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+        assert [r.getMessage() for r in warnings] == [
+            'Index "secret-a" matches denied pattern: secret-*'
+        ] * 3
+
     def test_comma_separated_indexes(self):
         """Test handling of comma-separated index names."""
         config = IndexFilterConfig(
@@ -112,6 +299,11 @@ class TestIndexFilterConfig:
         assert is_allowed is False
         assert 'logs-sensitive-data' in reason
 
+        # One not allowed, reported with the offending name
+        is_allowed, reason = config.is_index_allowed('logs-public, other-index')
+        assert is_allowed is False
+        assert reason == 'Index "other-index" does not match any allowed patterns'
+
     def test_wildcard_in_index_name_bypasses_validation(self):
         """Test that index names with wildcards bypass validation."""
         config = IndexFilterConfig(allowed_index_patterns=['logs-*'])
@@ -123,6 +315,12 @@ class TestIndexFilterConfig:
 
         is_allowed, _ = config.is_index_allowed('test-?-index')
         assert is_allowed is True
+        assert config._cached_check.cache_info().currsize == 0
+
+        # Other names in a comma-separated list are still validated
+        is_allowed, reason = config.is_index_allowed('metrics-*,secret-data')
+        assert is_allowed is False
+        assert 'secret-data' in reason
 
     def test_question_mark_wildcard(self):
         """Test question mark wildcard pattern."""
@@ -175,11 +373,94 @@ class TestIndexFilterConfig:
         is_allowed, _ = config.is_index_allowed('other-index')
         assert is_allowed is False
 
+    def test_re2_matches_like_re(self):
+        """Test that patterns compiled with RE2 match the same names as with re."""
+        pytest.importorskip('re2')
+        config = IndexFilterConfig(
+            allowed_index_patterns=['logs-*-*', 'test-?-index', 'regex:^app-\\d+$'],
+            denied_index_patterns=['regex:^(?!keep).*-dev$', 'logs-[0-9]*'],
+        )
+
+        assert config.is_index_allowed('logs-web-prod') == (True, None)
+        assert config.is_index_allowed('test-1-index') == (True, None)
+        assert config.is_index_allowed('app-42') == (True, None)
+        is_allowed, reason = config.is_index_allowed('keep-dev')
+        assert is_allowed is False
+        assert 'does not match any allowed patterns' in reason
+        is_allowed, reason = config.is_index_allowed('app-dev')
+        assert is_allowed is False
+        assert reason.endswith('matches denied pattern: regex:^(?!keep).*-dev$')
+        is_allowed, reason = config.is_index_allowed('logs-1-web')
+        assert is_allowed is False
+        assert reason.endswith('matches denied pattern: logs-[0-9]*')
+
+        # Regex patterns keep re semantics where RE2 differs
+        config = IndexFilterConfig(
+            allowed_index_patterns=['regex:^app-\\d+$', 'logs-*[0-9]*-x', 'tmp-[z-a]']
+        )
+        assert config._first_allowed('app-12\n') == 'regex:^app-\\d+$'
+        assert config.is_index_allowed('app-\u0661\u0662') == (True, None)
+        assert config.is_index_allowed('logs-web1-x') == (True, None)
+        assert config.is_index_allowed('logs-web-x')[0] is False
+        assert config.is_index_allowed('tmp-q')[0] is False
+
+    def test_translate_glob_re2(self):
+        """Test that plain wildcards are translated without fnmatch backreferences."""
+        assert _translate_glob_re2('logs-*') == 'logs\\-.*'
+        assert _translate_glob_re2('a?b') == 'a.b'
+        assert _translate_glob_re2('logs-*-*') == 'logs\\-.*\\-.*'
+        assert _translate_glob_re2('logs-*[0-9]*-x') == 'logs\\-.*[0-9].*\\-x'
+        assert _translate_glob_re2('a[!b]c') == 'a[^b]c'
+        assert _translate_glob_re2('a[b') == 'a\\[b'
+        assert re.fullmatch(_translate_glob_re2('logs-[0-9]*'), 'logs-1-web')
+        # fnmatch translates an empty range to (?!), which RE2 does not accept
+        assert _translate_glob_re2('tmp-[z-a]') == 'tmp\\-[^\\x00-\\x{10FFFF}]'
+
+    def test_wildcards_use_re2(self, monkeypatch):
+        """Test that only the wildcard alternation is compiled with re2 when it is available."""
+        fake_re2 = FakeRe2()
+        monkeypatch.setattr(tools.index_filter, 're2', fake_re2)
+
+        config = IndexFilterConfig(
+            allowed_index_patterns=['logs-*-*', 'test-?-index', 'regex:^app-\\d+$']
+        )
+
+        assert fake_re2.compiled == ['(?s:(?P<p0>logs\\-.*\\-.*)|(?P<p1>test\\-.\\-index))\\z']
+        assert config.is_index_allowed('logs-web-prod') == (True, None)
+        assert config.is_index_allowed('test-1-index') == (True, None)
+        is_allowed, _ = config.is_index_allowed('logs-web')
+        assert is_allowed is False
+
+    def test_regex_patterns_keep_re_semantics_with_re2(self, monkeypatch):
+        """Test that regex patterns match as with re, where RE2 would differ."""
+        monkeypatch.setattr(tools.index_filter, 're2', FakeRe2())
+
+        config = IndexFilterConfig(
+            allowed_index_patterns=['regex:^app-\\d+$', 'regex:^\\w+-logs\\b']
+        )
+
+        # re lets $ match before a trailing newline and treats \d and \w as Unicode
+        assert config._first_allowed('app-12\n') == 'regex:^app-\\d+$'
+        assert config.is_index_allowed('app-\u0661\u0662') == (True, None)
+        assert config.is_index_allowed('caf\u00e9-logs') == (True, None)
+        is_allowed, _ = config.is_index_allowed('app-x')
+        assert is_allowed is False
+
+    def test_glob_alternation_falls_back_to_re(self, monkeypatch):
+        """Test that a wildcard alternation rejected by re2 is compiled with re instead."""
+        fake_re2 = FakeRe2()
+        monkeypatch.setattr(tools.index_filter, 're2', fake_re2)
+
+        fused = _compile_glob_alternation('(?P<p0>a(?=b))', '(?P<p0>a(?=b))')
+        assert fake_re2.compiled == []
+        assert isinstance(fused, re.Pattern)
+        assert fused.match('ab').lastgroup == 'p0'
+
 
 class TestLoadIndexFilterConfig:
     """Test loading index filter configuration."""
 
-    def test_load_from_yaml_file(self):
+    def test_load_from_yaml_file(self, yaml_config_file):
         """Test loading configuration from YAML file."""
         config_data = {
             'index_security': {
@@ -188,44 +469,88 @@ class TestLoadIndexFilterConfig:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_file = f.name
+        config_file = yaml_config_file(config_data)
+
+        config = load_index_filter_config(config_file)
+        assert config.allowed_index_patterns == ['logs-*', 'metrics-*']
+        assert config.denied_index_patterns == ['sensitive-*']
+
+    def test_reload_reuses_config_when_unchanged(self, tmp_path):
+        """Test that reloading unchanged inputs returns the same instance."""
+        # The file is rewritten below, so it must not be shared with other tests
+        config_file = str(tmp_path / 'config.yml')
+        with open(config_file, 'w') as f:
+            yaml.dump(
+                {'index_security': {'allowed_index_patterns': ['logs-*']}}, f, Dumper=SafeDumper
+            )
+
+        config = load_index_filter_config(config_file)
+        assert load_index_filter_config(config_file) is config
+
+        with open(config_file, 'w') as f:
+            yaml.dump(
+                {'index_security': {'allowed_index_patterns': ['metrics-*']}}, f, Dumper=SafeDumper
+            )
+        reloaded = load_index_filter_config(config_file)
+        assert reloaded is not config
+        assert reloaded.allowed_index_patterns == ['metrics-*']
+
+    def test_yaml_parse_reused_while_file_unchanged(self, yaml_config_file, monkeypatch):
+        """Test that an unchanged YAML file is not parsed again."""
+        config_file = yaml_config_file({'index_security': {'allowed_index_patterns': ['logs-*']}})
+
+        load_index_filter_config(config_file)
+        hits = _parse_yaml.cache_info().hits
+
+        # A changed environment reloads the configuration but not the file
+        monkeypatch.setenv('OPENSEARCH_ALLOWED_INDEX_PATTERNS', 'metrics-*')
+        config = load_index_filter_config(config_file)
+        assert config.allowed_index_patterns == ['logs-*']
+        assert _parse_yaml.cache_info().hits == hits + 1
+
+    def test_touched_file_with_same_contents_keeps_config(self, tmp_path):
+        """Test that a rewrite with identical contents is neither parsed nor rebuilt."""
+        config_file = str(tmp_path / 'config.yml')
+        with open(config_file, 'w') as f:
+            yaml.dump(
+                {'index_security': {'allowed_index_patterns': ['logs-*']}}, f, Dumper=SafeDumper
+            )
+        config = load_index_filter_config(config_file)
+        misses = _parse_yaml_content.cache_info().misses
+
+        stat = os.stat(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert load_index_filter_config(config_file) is config
+        assert _parse_yaml_content.cache_info().misses == misses
+
+    def test_load_from_environment_json_array(self, monkeypatch):
+        """Test loading configuration from environment variables (JSON array format)."""
+        monkeypatch.setenv('OPENSEARCH_ALLOWED_INDEX_PATTERNS', '["logs-*", "metrics-*"]')
+        monkeypatch.setenv('OPENSEARCH_DENIED_INDEX_PATTERNS', '["sensitive-*"]')
 
-        try:
-            config = load_index_filter_config(config_file)
-            assert config.allowed_index_patterns == ['logs-*', 'metrics-*']
-            assert config.denied_index_patterns == ['sensitive-*']
-        finally:
-            os.unlink(config_file)
+        config = load_index_filter_config()
+        assert config.allowed_index_patterns == ['logs-*', 'metrics-*']
+        assert config.denied_index_patterns == ['sensitive-*']
 
-    def test_load_from_environment_json_array(self):
-        """Test loading configuration from environment variables (JSON array format)."""
-        os.environ['OPENSEARCH_ALLOWED_INDEX_PATTERNS'] = '["logs-*", "metrics-*"]'
-        os.environ['OPENSEARCH_DENIED_INDEX_PATTERNS'] = '["sensitive-*"]'
-
-        try:
-            config = load_index_filter_config()
-            assert config.allowed_index_patterns == ['logs-*', 'metrics-*']
-            assert config.denied_index_patterns == ['sensitive-*']
-        finally:
-            del os.environ['OPENSEARCH_ALLOWED_INDEX_PATTERNS']
-            del os.environ['OPENSEARCH_DENIED_INDEX_PATTERNS']
-
-    def test_load_from_environment_comma_separated(self):
+    def test_load_from_environment_comma_separated(self, monkeypatch):
         """Test loading configuration from environment variables (comma-separated format)."""
-        os.environ['OPENSEARCH_ALLOWED_INDEX_PATTERNS'] = 'logs-*, metrics-*, app-*'
-        os.environ['OPENSEARCH_DENIED_INDEX_PATTERNS'] = 'sensitive-*, temp-*'
-
-        try:
-            config = load_index_filter_config()
-            assert config.allowed_index_patterns == ['logs-*', 'metrics-*', 'app-*']
-            assert config.denied_index_patterns == ['sensitive-*', 'temp-*']
-        finally:
-            del os.environ['OPENSEARCH_ALLOWED_INDEX_PATTERNS']
-            del os.environ['OPENSEARCH_DENIED_INDEX_PATTERNS']
-
-    def test_yaml_takes_priority_over_env(self):
+        monkeypatch.setenv('OPENSEARCH_ALLOWED_INDEX_PATTERNS', 'logs-*, metrics-*, app-*')
+        monkeypatch.setenv('OPENSEARCH_DENIED_INDEX_PATTERNS', 'sensitive-*, temp-*')
+
+        config = load_index_filter_config()
+        assert config.allowed_index_patterns == ['logs-*', 'metrics-*', 'app-*']
+        assert config.denied_index_patterns == ['sensitive-*', 'temp-*']
+
+    def test_load_from_environment_invalid_json(self, monkeypatch):
+        """Test that an invalid JSON array in the environment is ignored."""
+        monkeypatch.setenv('OPENSEARCH_ALLOWED_INDEX_PATTERNS', '["logs-*"')
+        monkeypatch.setenv('OPENSEARCH_DENIED_INDEX_PATTERNS', ' sensitive-* ,, temp-* ')
+
+        config = load_index_filter_config()
+        assert config.allowed_index_patterns == []
+        assert config.denied_index_patterns == ['sensitive-*', 'temp-*']
+
+    def test_yaml_takes_priority_over_env(self, yaml_config_file, monkeypatch):
         """Test that YAML configuration takes priority over environment variables."""
         config_data = {
             'index_security': {
@@ -234,100 +559,93 @@ class TestLoadIndexFilterConfig:
             }
         }
 
-        os.environ['OPENSEARCH_ALLOWED_INDEX_PATTERNS'] = '["from-env-*"]'
-        os.environ['OPENSEARCH_DENIED_INDEX_PATTERNS'] = '["env-denied-*"]'
+        monkeypatch.setenv('OPENSEARCH_ALLOWED_INDEX_PATTERNS', '["from-env-*"]')
+        monkeypatch.setenv('OPENSEARCH_DENIED_INDEX_PATTERNS', '["env-denied-*"]')
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_file = f.name
+        config_file = yaml_config_file(config_data)
 
-        try:
-            config = load_index_filter_config(config_file)
-            # Should use YAML config, not env vars
-            assert config.allowed_index_patterns == ['from-yaml-*']
-            assert config.denied_index_patterns == ['yaml-denied-*']
-        finally:
-            os.unlink(config_file)
-            del os.environ['OPENSEARCH_ALLOWED_INDEX_PATTERNS']
-            del os.environ['OPENSEARCH_DENIED_INDEX_PATTERNS']
+        config = load_index_filter_config(config_file)
+        # Should use YAML config, not env vars
+        assert config.allowed_index_patterns == ['from-yaml-*']
+        assert config.denied_index_patterns == ['yaml-denied-*']
 
-    def test_load_empty_config(self):
+    def test_load_empty_config(self, yaml_config_file):
         """Test loading with no configuration."""
         config = load_index_filter_config()
         assert config.allowed_index_patterns == []
         assert config.denied_index_patterns == []
+        # Consecutive loads without patterns keep the loaded instance
+        assert load_index_filter_config(yaml_config_file({'index_security': {}})) is config
 
-    def test_load_missing_index_security_section(self):
+    def test_loaded_config_not_shared_after_mutation(self, yaml_config_file, monkeypatch):
+        """Test that modifying a loaded configuration does not leak into later loads."""
+        config = load_index_filter_config()
+        config.allowed_index_patterns.append('logs-*')
+
+        monkeypatch.setenv('OPENSEARCH_ALLOWED_INDEX_PATTERNS', '[]')
+        reloaded = load_index_filter_config()
+        assert reloaded is not config
+        assert reloaded.allowed_index_patterns == []
+        assert IndexFilterConfig().allowed_index_patterns == []
+
+        # The patterns are copied, so the cached YAML parse is never modified
+        config_data = {'index_security': {'denied_index_patterns': ['secret-*']}}
+        config_file = yaml_config_file(config_data)
+        load_index_filter_config(config_file).denied_index_patterns.append('other-*')
+        with open(config_file, 'rb') as f:
+            assert _parse_yaml_content(f.read()) == config_data
+
+    def test_load_missing_index_security_section(self, yaml_config_file):
         """Test loading YAML without index_security section."""
         config_data = {'clusters': {'cluster1': {'opensearch_url': 'http://localhost:9200'}}}
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_file = f.name
+        config_file = yaml_config_file(config_data)
 
-        try:
-            config = load_index_filter_config(config_file)
-            assert config.allowed_index_patterns == []
-            assert config.denied_index_patterns == []
-        finally:
-            os.unlink(config_file)
+        config = load_index_filter_config(config_file)
+        assert config.allowed_index_patterns == []
+        assert config.denied_index_patterns == []
 
 
 class TestValidateIndexAccess:
     """Test validate_index_access function."""
 
-    def test_validate_allowed_index(self):
+    def test_validate_allowed_index(self, yaml_config_file):
         """Test validation of allowed index."""
         config_data = {'index_security': {'allowed_index_patterns': ['logs-*']}}
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_file = f.name
+        config_file = yaml_config_file(config_data)
 
-        try:
-            # Load config
-            load_index_filter_config(config_file)
+        # Load config
+        load_index_filter_config(config_file)
 
-            # Should not raise exception
-            validate_index_access('logs-2024-01')
-        finally:
-            os.unlink(config_file)
+        # Should not raise exception
+        validate_index_access('logs-2024-01')
 
-    def test_validate_denied_index_raises_exception(self):
+    def test_validate_denied_index_raises_exception(self, yaml_config_file):
         """Test validation of denied index raises exception."""
         config_data = {'index_security': {'denied_index_patterns': ['sensitive-*']}}
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_file = f.name
+        config_file = yaml_config_file(config_data)
 
-        try:
-            # Load config
-            load_index_filter_config(config_file)
+        # Load config
+        load_index_filter_config(config_file)
 
-            # Should raise exception
-            with pytest.raises(Exception) as exc_info:
-                validate_index_access('sensitive-data')
+        # Should raise exception
+        with pytest.raises(Exception) as exc_info:
+            validate_index_access('sensitive-data')
 
-            assert 'Index access denied' in str(exc_info.value)
-            assert 'sensitive-data' in str(exc_info.value)
-        finally:
-            os.unlink(config_file)
+        assert 'Index access denied' in str(exc_info.value)
+        assert 'sensitive-data' in str(exc_info.value)
 
-    def test_validate_empty_index(self):
+    def test_validate_empty_index(self, yaml_config_file):
         """Test validation of empty index."""
         config_data = {'index_security': {'allowed_index_patterns': ['logs-*']}}
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_file = f.name
+        config_file = yaml_config_file(config_data)
 
-        try:
-            # Load config
-            load_index_filter_config(config_file)
+        # Load config
+        load_index_filter_config(config_file)
 
-            # Empty index should not raise exception
-            validate_index_access('')
-            validate_index_access(None)
-        finally:
-            os.unlink(config_file)
+        # Empty index should not raise exception
+        validate_index_access('')
+        validate_index_access(None)
@@ -33,6 +33,13 @@ class TestTools:
         )
         self.init_client_patcher.start()
 
+        # Drop helper responses and versions cached by previous tests
+        from opensearch.helper import invalidate_version_cache
+        from opensearch.response_cache import clear_response_cache
+
+        clear_response_cache()
+        invalidate_version_cache()
+
         # Reset the global index filter config to allow all indices (no filtering)
         import tools.index_filter
         tools.index_filter._index_filter_config = tools.index_filter.IndexFilterConfig(
@@ -156,38 +163,13 @@ class TestTools:
         assert '"docs.count": "100"' in result[0]['text']
         assert '"index": "index2"' in result[0]['text']
         assert '"docs.count": "200"' in result[0]['text']
-        self.mock_client.cat.indices.assert_called_once_with(format='json')
+        self.mock_client.cat.indices.assert_called_once_with(format='json', h=None)
 
     @pytest.mark.asyncio
     async def test_list_indices_tool_include_detail_false(self):
         """When include_detail=False, returns only pure list of index names (filtered)."""
-        # Setup
-        self.mock_client.cat.indices.return_value = [
-            {
-                'health': 'green',
-                'status': 'open',
-                'index': 'index1',
-                'uuid': 'uuid1',
-                'pri': '1',
-                'rep': '1',
-                'docs.count': '100',
-                'docs.deleted': '5',
-                'store.size': '1mb',
-                'pri.store.size': '0.5mb',
-            },
-            {
-                'health': 'yellow',
-                'status': 'open',
-                'index': 'index2',
-                'uuid': 'uuid2',
-                'pri': '2',
-                'rep': '2',
-                'docs.count': '200',
-                'docs.deleted': '10',
-                'store.size': '2mb',
-                'pri.store.size': '1mb',
-            },
-        ]
+        # Setup: only the index column is requested from OpenSearch
+        self.mock_client.cat.indices.return_value = [{'index': 'index1'}, {'index': 'index2'}]
         # Execute
         result = await self._list_indices_tool(self.ListIndicesArgs(include_detail=False))
         # Assert
@@ -196,7 +178,7 @@ class TestTools:
         payload = json.loads(result[0]['text'].split('\n', 1)[1])
         assert payload == ['index1', 'index2']
         assert 'docs.count' not in result[0]['text']
-        self.mock_client.cat.indices.assert_called_once_with(format='json')
+        self.mock_client.cat.indices.assert_called_once_with(format='json', h='index')
 
     @pytest.mark.asyncio
     async def test_list_indices_tool_with_index(self):
@@ -225,6 +207,17 @@ class TestTools:
         )
         self.mock_client.indices.get.assert_called_once_with(index='index1')
 
+    @pytest.mark.asyncio
+    async def test_tool_not_supported_for_version(self):
+        """Tools report the supported version range on older clusters."""
+        self.mock_client.info.return_value = {'version': {'number': '0.9.0'}}
+        args = self.ListIndicesArgs(index='index1')
+        result = await self._list_indices_tool(args)
+        assert len(result) == 1
+        assert "Tool 'ListIndexTool' is not supported for this OpenSearch version" in result[0]['text']
+        assert '(current version: 0.9.0). Supported version: 1.0.0 or later.' in result[0]['text']
+        self.mock_client.indices.get.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_list_indices_tool_with_index_filtered(self):
         """Deprecated behavior removed: index with include_detail=False should still return details (kept to ensure no regression to name-only)."""
@@ -257,7 +250,7 @@ class TestTools:
         assert len(result) == 1
         assert result[0]['type'] == 'text'
         assert 'Error listing indices: Test error' in result[0]['text']
-        self.mock_client.cat.indices.assert_called_once_with(format='json')
+        self.mock_client.cat.indices.assert_called_once_with(format='json', h=None)
 
     @pytest.mark.asyncio
     async def test_get_index_mapping_tool(self):
@@ -397,7 +390,7 @@ class TestTools:
         assert 'Cluster state information' in result[0]['text']
         assert '"cluster_name": "test-cluster"' in result[0]['text']
         assert '"master_node": "node1"' in result[0]['text']
-        self.mock_client.cluster.state.assert_called_once_with()
+        self.mock_client.cluster.state.assert_called_once_with(metric=None, index=None)
     
     @pytest.mark.asyncio
     async def test_get_cluster_state_tool_with_metric(self):
@@ -425,7 +418,7 @@ class TestTools:
         assert 'Cluster state information for metric: nodes' in result[0]['text']
         assert '"cluster_name": "test-cluster"' in result[0]['text']
         assert '"nodes"' in result[0]['text']
-        self.mock_client.cluster.state.assert_called_once_with(metric='nodes')
+        self.mock_client.cluster.state.assert_called_once_with(metric='nodes', index=None)
     
     @pytest.mark.asyncio
     async def test_get_cluster_state_tool_with_index(self):
@@ -453,8 +446,23 @@ class TestTools:
         assert result[0]['type'] == 'text'
         assert 'Cluster state information, filtered by index: test-index' in result[0]['text']
         assert '"test-index"' in result[0]['text']
-        self.mock_client.cluster.state.assert_called_once_with(index='test-index')
+        self.mock_client.cluster.state.assert_called_once_with(metric=None, index='test-index')
     
+    @pytest.mark.asyncio
+    async def test_get_cluster_state_tool_large_response(self, monkeypatch):
+        """Test that large cluster states are split across several text items."""
+        monkeypatch.setattr('tools.tools.RESPONSE_CHUNK_SIZE', 16)
+        mock_state = {'cluster_name': 'test-cluster', 'metadata': {'indices': {'a': {}, 'b': {}}}}
+        self.mock_client.cluster.state.return_value = mock_state
+
+        result = await self._get_cluster_state_tool(self.GetClusterStateArgs())
+
+        assert len(result) > 2
+        assert result[0] == {'type': 'text', 'text': 'Cluster state information:'}
+        assert all(len(item['text']) <= 16 for item in result[1:])
+        body = ''.join(item['text'] for item in result[1:])
+        assert json.loads(body) == mock_state
+
     @pytest.mark.asyncio
     async def test_get_cluster_state_tool_error(self):
         """Test get_cluster_state_tool exception handling."""
@@ -469,7 +477,7 @@ class TestTools:
         assert len(result) == 1
         assert result[0]['type'] == 'text'
         assert 'Error getting cluster state: Test error' in result[0]['text']
-        self.mock_client.cluster.state.assert_called_once_with()
+        self.mock_client.cluster.state.assert_called_once_with(metric=None, index=None)
     
     @pytest.mark.asyncio
     async def test_get_segments_tool(self):
@@ -615,6 +623,16 @@ class TestTools:
         assert 'node1 | 127.0.0.1 | 50' in result[0]['text']
         self.mock_client.cat.nodes.assert_called_once_with(format='json', h='name,ip,heap.percent')
     
+    @pytest.mark.asyncio
+    async def test_cat_nodes_tool_single_metric_and_missing_values(self):
+        """Test cat_nodes_tool with one column and rows missing that column."""
+        self.mock_client.cat.nodes.return_value = [{'name': 'node1'}, {}]
+
+        args = self.CatNodesArgs(metrics='name')
+        result = await self._cat_nodes_tool(args)
+
+        assert result[0]['text'].endswith(':\nname\nnode1\nN/A\n')
+    
     @pytest.mark.asyncio
     async def test_cat_nodes_tool_error(self):
         """Test cat_nodes_tool exception handling."""
@@ -725,7 +743,7 @@ class TestTools:
         assert result[0]['type'] == 'text'
         assert 'Statistics for index: test-index' in result[0]['text']
         assert '"docs": {"count": 1000, "deleted": 10}' in result[0]['text'] or '"count": 1000' in result[0]['text']
-        self.mock_client.indices.stats.assert_called_once_with(index='test-index')
+        self.mock_client.indices.stats.assert_called_once_with(index='test-index', metric=None)
     
     @pytest.mark.asyncio
     async def test_get_index_stats_tool_with_metric(self):
@@ -778,7 +796,7 @@ class TestTools:
         assert len(result) == 1
         assert result[0]['type'] == 'text'
         assert 'Error getting index statistics: Test error' in result[0]['text']
-        self.mock_client.indices.stats.assert_called_once_with(index='test-index')
+        self.mock_client.indices.stats.assert_called_once_with(index='test-index', metric=None)
     
     @pytest.mark.asyncio
     async def test_get_query_insights_tool(self):
@@ -979,7 +997,7 @@ class TestTools:
                 'node': 'node2'
             }
         ]
-        self.mock_client.transport.perform_request.return_value = mock_tasks
+        self.mock_client.cat.tasks.return_value = mock_tasks
         
         # Execute
         args = self.GetLongRunningTasksArgs()
@@ -992,14 +1010,7 @@ class TestTools:
         assert 'action | task_id | parent_task_id | type | start_time | timestamp | running_time_ns | running_time | node_id | ip | node' in result[0]['text'] or 'action' in result[0]['text']
         assert 'indices:data/write/bulk' in result[0]['text']
         assert 'indices:data/read/search' in result[0]['text']
-        self.mock_client.transport.perform_request.assert_called_once_with(
-            method='GET',
-            url='/_cat/tasks',
-            params={
-                's': 'running_time:desc',
-                'format': 'json'
-            }
-        )
+        self.mock_client.cat.tasks.assert_called_once_with(format='json', s='running_time:desc')
     
     @pytest.mark.asyncio
     async def test_get_long_running_tasks_tool_with_limit(self):
@@ -1022,7 +1033,7 @@ class TestTools:
                 'node': 'node1'
             }
         ]
-        self.mock_client.transport.perform_request.return_value = mock_tasks
+        self.mock_client.cat.tasks.return_value = mock_tasks
         
         # Execute
         args = self.GetLongRunningTasksArgs(limit=2)
@@ -1035,20 +1046,13 @@ class TestTools:
         assert 'indices:data/write/bulk' in result[0]['text']
         assert 'indices:data/read/search' in result[0]['text']
         assert 'indices:admin/create' not in result[0]['text']
-        self.mock_client.transport.perform_request.assert_called_once_with(
-            method='GET',
-            url='/_cat/tasks',
-            params={
-                's': 'running_time:desc',
-                'format': 'json'
-            }
-        )
+        self.mock_client.cat.tasks.assert_called_once_with(format='json', s='running_time:desc')
     
     @pytest.mark.asyncio
     async def test_get_long_running_tasks_tool_error(self):
         """Test get_long_running_tasks_tool exception handling."""
         # Setup
-        self.mock_client.transport.perform_request.side_effect = Exception('Test error')
+        self.mock_client.cat.tasks.side_effect = Exception('Test error')
         
         # Execute
         args = self.GetLongRunningTasksArgs()
@@ -1058,14 +1062,7 @@ class TestTools:
         assert len(result) == 1
         assert result[0]['type'] == 'text'
         assert 'Error getting long-running tasks information: Test error' in result[0]['text']
-        self.mock_client.transport.perform_request.assert_called_once_with(
-            method='GET',
-            url='/_cat/tasks',
-            params={
-                's': 'running_time:desc',
-                'format': 'json'
-            }
-        )
+        self.mock_client.cat.tasks.assert_called_once_with(format='json', s='running_time:desc')
     
     @pytest.mark.asyncio
     async def test_get_nodes_tool_success(self):
@@ -1114,7 +1111,7 @@ class TestTools:
                 }
             }
         }
-        self.mock_client.transport.perform_request.return_value = mock_response
+        self.mock_client.nodes.info.return_value = mock_response
         
         # Execute
         args = self.GetNodesArgs()
@@ -1127,10 +1124,7 @@ class TestTools:
         assert '"name": "node-1"' in result[0]['text']
         assert '"name": "node-2"' in result[0]['text']
         assert '"cluster_name": "test-cluster"' in result[0]['text']
-        self.mock_client.transport.perform_request.assert_called_once_with(
-            method='GET',
-            url='/_nodes'
-        )
+        self.mock_client.nodes.info.assert_called_once_with(node_id=None, metric=None)
 
     @pytest.mark.asyncio
     async def test_get_nodes_tool_with_filters(self):
@@ -1159,7 +1153,7 @@ class TestTools:
                 }
             }
         }
-        self.mock_client.transport.perform_request.return_value = mock_response
+        self.mock_client.nodes.info.return_value = mock_response
         
         # Execute
         args = self.GetNodesArgs(node_id="master:true", metric="process,transport")
@@ -1171,16 +1165,15 @@ class TestTools:
         assert 'Detailed node information for nodes: master:true' in result[0]['text']
         assert '(metrics: process,transport)' in result[0]['text']
         assert '"name": "master-node"' in result[0]['text']
-        self.mock_client.transport.perform_request.assert_called_once_with(
-            method='GET',
-            url='/_nodes/master:true/process,transport'
+        self.mock_client.nodes.info.assert_called_once_with(
+            node_id='master:true', metric='process,transport'
         )
 
     @pytest.mark.asyncio
     async def test_get_nodes_tool_error(self):
         """Test get_nodes_tool exception handling."""
         # Setup
-        self.mock_client.transport.perform_request.side_effect = Exception('Test error')
+        self.mock_client.nodes.info.side_effect = Exception('Test error')
         
         # Execute
         args = self.GetNodesArgs()
@@ -1190,10 +1183,7 @@ class TestTools:
         assert len(result) == 1
         assert result[0]['type'] == 'text'
         assert 'Error getting nodes information: Test error' in result[0]['text']
-        self.mock_client.transport.perform_request.assert_called_once_with(
-            method='GET',
-            url='/_nodes'
-        )
+        self.mock_client.nodes.info.assert_called_once_with(node_id=None, metric=None)
 
     def test_tool_registry(self):
         """Test TOOL_REGISTRY structure."""